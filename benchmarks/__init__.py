@@ -0,0 +1 @@
+"""Headless performance benchmarks for the Horizon Scanning dashboard."""
@@ -0,0 +1,209 @@
+"""Cold-start and per-interaction rerun latency of streamlit_app.py, driven headlessly.
+
+    python -m benchmarks.rerun_latency --sizes 200x90 2000x500 --output bench.json
+    python -m benchmarks.rerun_latency --baseline benchmarks/baseline.json
+
+Each size is an ``ENTITIESxCOLUMNS`` synthetic dataset. The report records wall
+time for every step, the process's peak RSS so far and how much the step raised
+it (``--trace-memory`` adds the peak of Python-traced allocations, at a large
+cost in speed); with ``--baseline`` steps
+slower than ``--tolerance`` × the baseline are listed and the exit code is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "streamlit_app.py")
+DEFAULT_SIZES = ["200x90", "2000x500"]
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import streamlit as st  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from benchmarks.synthetic import write_fixture  # noqa: E402
+
+
+def _parse_size(size: str) -> tuple:
+    entities, columns = size.lower().split("x")
+    return int(entities), int(columns)
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1e6 if sys.platform == "darwin" else 1e3), 1)
+
+
+def _measure(fn, trace_memory: bool = False) -> dict:
+    if trace_memory:
+        tracemalloc.start()
+    before = _peak_rss_mb()
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    # ru_maxrss only ever grows: a step under the earlier high-water mark adds 0
+    after = _peak_rss_mb()
+    result = {
+        "seconds": round(seconds, 4),
+        "process_peak_rss_mb": after,
+        "rss_growth_mb": None if after is None else round(after - before, 1),
+    }
+    if trace_memory:
+        result["traced_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+        tracemalloc.stop()
+    return result
+
+
+def _run(at: AppTest, view: str, action=None) -> None:
+    """Rerun with ``view`` open (AppTest does not resend the tab widget's state itself)."""
+    at.session_state["active_view"] = view
+    (action(at) if action else at).run()
+    if at.exception:
+        raise RuntimeError(f"{view}: {at.exception[0].message}")
+
+
+def _button(label: str):
+    return lambda at: next(b for b in at.button if b.label == label).click()
+
+
+def _click_and_wait(label: str, job_key: str):
+    """Click ``label``, wait for the pool job it started, then rerun once so its result is applied."""
+    def action(at: AppTest):
+        _button(label)(at).run()
+        job = at.session_state[job_key] if job_key in at.session_state else None
+        if job is not None:
+            job.wait()
+        return at
+    return action
+
+
+def _half_categories(at: AppTest):
+    box = at.multiselect[0]
+    return box.set_value(box.options[: max(1, len(box.options) // 2)])
+
+
+def bench_size(entities: int, columns: int, timeout: float, trace_memory: bool = False) -> dict:
+    workdir = tempfile.mkdtemp(prefix="horizon-bench-")
+    cwd = os.getcwd()
+    steps, errors = {}, []
+    try:
+        write_fixture(workdir, entities, columns)
+        os.chdir(workdir)
+
+        def new_session() -> AppTest:
+            return AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+        def step(name: str, fn) -> None:
+            try:
+                steps[name] = _measure(fn, trace_memory)
+            except Exception as e:  # keep measuring the remaining steps
+                errors.append(f"{name}: {e}")
+
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        at = new_session()
+        step("cold_start", lambda: _run(at, "Horizon Scanning"))
+
+        # Process caches cleared again, Parquet side-cache left in place
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        step("cold_start_parquet", lambda: _run(new_session(), "Horizon Scanning"))
+
+        at = new_session()
+        step("warm_session_start", lambda: _run(at, "Horizon Scanning"))
+        step("open_data_preparation", lambda: _run(at, "Data Preparation"))
+        step("tab2_apply", lambda: _run(at, "Data Preparation", _click_and_wait("Apply selected actions", "apply_job")))
+        step("open_model_selection", lambda: _run(at, "Model Selection"))
+        step("model_switch", lambda: _run(at, "Model Selection", lambda a: a.selectbox[0].select("Technology")))
+        step("open_chart", lambda: _run(at, "Chart"))
+        step("chart_filter", lambda: _run(at, "Chart", _half_categories))
+        step("reopen_model_selection", lambda: _run(at, "Model Selection"))
+        step("custom_model", lambda: _run(at, "Model Selection", lambda a: a.selectbox[0].select("Custom")))
+        step("live_preview_on", lambda: _run(at, "Model Selection", lambda a: a.toggle[0].set_value(True)))
+        step("slider_change", lambda: _run(at, "Model Selection", lambda a: a.slider[0].set_value(5)))
+        step("open_results_drivers", lambda: _run(at, "Results Drivers"))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {"entities": entities, "columns": columns, "steps": steps, "errors": errors}
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    """Steps whose time exceeds ``tolerance`` × the baseline for the same dataset size."""
+    base = {(r["entities"], r["columns"]): r["steps"] for r in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        previous = base.get((result["entities"], result["columns"]), {})
+        for name, now in result["steps"].items():
+            before = previous.get(name)
+            if before and before["seconds"] > 0 and now["seconds"] > tolerance * before["seconds"]:
+                regressions.append({
+                    "size": f"{result['entities']}x{result['columns']}",
+                    "step": name,
+                    "baseline_s": before["seconds"],
+                    "current_s": now["seconds"],
+                    "ratio": round(now["seconds"] / before["seconds"], 2),
+                })
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="ENTITIESxCOLUMNS, e.g. 100000x5000")
+    parser.add_argument("--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="compare against this report")
+    parser.add_argument("--save-baseline", action="store_true", help=f"also write the report to {DEFAULT_BASELINE}")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="allowed slowdown ratio (default 1.25)")
+    parser.add_argument("--timeout", type=float, default=600, help="per-rerun timeout in seconds")
+    parser.add_argument("--trace-memory", action="store_true", help="also record tracemalloc peaks (slow)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": st.__version__,
+        "machine": platform.machine(),
+        "results": [bench_size(*_parse_size(s), timeout=args.timeout, trace_memory=args.trace_memory) for s in args.sizes],
+    }
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            report["regressions"] = compare(report, json.load(f), args.tolerance)
+        status = 1 if report["regressions"] else 0
+    if any(r["errors"] for r in report["results"]):
+        status = 1
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(DEFAULT_BASELINE, "w") as f:
+            f.write(text + "\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
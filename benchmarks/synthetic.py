@@ -0,0 +1,71 @@
+"""Synthetic ALL_RAW-shaped datasets and weight files for benchmarking."""
+import os
+
+import numpy as np
+import pandas as pd
+
+PRESET_MODELS = ["Strategic Environment", "Technology", "Aviation"]
+DEBT_YEARS = range(2023, 2029)
+
+# Share of the variable columns given to each axis (roughly ALL_RAW's mix)
+AXIS_SHARE = {"X": 0.4, "Y": 0.5, "Z": 0.1}
+
+
+def make_dataset(entities: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    """``entities`` rows × (Country, Region + ``columns`` X_/Y_/Z_ variables).
+
+    Mirrors the real extract: padded header names, a year-suffixed
+    ``Y_Government_debt_*`` series, low-cardinality integer flags and a few
+    missing values.
+    """
+    rng = np.random.default_rng(seed)
+    data = {
+        "Country": [f"Country_{i:06d}" for i in range(entities)],
+        "Region": rng.choice([f"Region{r}" for r in range(1, 11)], entities),
+    }
+
+    names = []
+    if columns >= 20:
+        names += [f"Y_Government_debt_{y}" for y in DEBT_YEARS]
+    remaining = columns - len(names)
+    counts = {axis: int(remaining * share) for axis, share in AXIS_SHARE.items()}
+    counts["Y"] += remaining - sum(counts.values())
+    for axis, count in counts.items():
+        names += [f"{axis}_Var{i:04d}" for i in range(count)]
+
+    for j, name in enumerate(names):
+        if name.startswith("Y_Government_debt_"):
+            values = rng.integers(1_000_000, 100_000_000, entities).astype(np.float64)
+        elif j % 4 == 0:
+            # Low-cardinality flags (exercise the Encode path)
+            values = rng.integers(0, 3, entities).astype(np.float64)
+        else:
+            values = rng.normal(50, 15, entities)
+        if j % 7 == 0:
+            values[rng.random(entities) < 0.02] = np.nan
+        # Padded headers, as in the real file
+        data[name + (" " if j % 2 else "")] = values
+
+    return pd.DataFrame(data)
+
+
+def make_weights(df: pd.DataFrame, per_axis: int = 10, seed: int = 0) -> pd.DataFrame:
+    """Preset-model weights over the dataset's own columns."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for model in PRESET_MODELS:
+        for axis in ["X", "Y", "Z"]:
+            variables = [c.strip() for c in df.columns if c.startswith(f"{axis}_")]
+            chosen = rng.choice(variables, size=min(per_axis, len(variables)), replace=False)
+            rows += [(model, axis, v, int(rng.integers(1, 6))) for v in chosen]
+    return pd.DataFrame(rows, columns=["Model", "Axis", "Variable", "Weight"])
+
+
+def write_fixture(directory: str, entities: int, columns: int, seed: int = 0) -> str:
+    """Write ``data/ALL_RAW.csv`` and ``data/model_weights.csv`` under ``directory``."""
+    data_dir = os.path.join(directory, "data")
+    os.makedirs(data_dir, exist_ok=True)
+    df = make_dataset(entities, columns, seed)
+    df.to_csv(os.path.join(data_dir, "ALL_RAW.csv"), index=False)
+    make_weights(df, seed=seed).to_csv(os.path.join(data_dir, "model_weights.csv"), index=False)
+    return directory
@@ -0,0 +1,31 @@
+"""Data and modelling helpers behind the Horizon Scanning dashboard."""
+from .data import derive_fingerprint, file_fingerprint, frame_fingerprint, load_dataset, read_csv
+from .encoding import UNKNOWN_CODE, CategoryEncoder
+from .prep import PrepPipeline
+from .scoring import AXES, LiveScorer, WeightMatrix, axis_variables, read_weights
+from .summary import guess_action, variable_summary
+from .weights_store import WeightsRepository
+from .years import YEARS, ScoreTensor, YearIndex, score_tensor
+
+__all__ = [
+    "AXES",
+    "UNKNOWN_CODE",
+    "YEARS",
+    "CategoryEncoder",
+    "LiveScorer",
+    "PrepPipeline",
+    "ScoreTensor",
+    "WeightMatrix",
+    "WeightsRepository",
+    "YearIndex",
+    "axis_variables",
+    "derive_fingerprint",
+    "file_fingerprint",
+    "frame_fingerprint",
+    "guess_action",
+    "load_dataset",
+    "read_csv",
+    "read_weights",
+    "score_tensor",
+    "variable_summary",
+]
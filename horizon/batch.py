@@ -0,0 +1,157 @@
+"""Headless batch scoring: every model × year for one or more datasets, written as Parquet.
+
+Uses the dashboard's own code paths (``load_dataset`` → ``PrepPipeline`` →
+``score_tensor``), so scores match what the Chart tab shows for the same data,
+Action table and weights.
+
+    $ python -m horizon.batch data/ALL_RAW.csv --out data/scores --guess-actions --workers 4
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .data import load_dataset
+from .prep import PrepPipeline
+from .scoring import read_weights
+from .summary import variable_summary
+from .weights_store import DB_PATH, WeightsRepository
+from .years import YEARS, score_tensor
+
+OUTPUT_DIR = os.path.join("data", "scores")
+PRESET_WEIGHTS = os.path.join("data", "model_weights.csv")
+CUSTOM_WEIGHTS = os.path.join("data", "custom_model_weights.csv")
+COMPRESSION = "zstd"
+
+ID_COLUMNS = ["Country", "Region"]
+
+
+def load_weights(paths: list = None, db_path: str = DB_PATH) -> pd.DataFrame:
+    """Weights from CSV ``paths`` if given, else the dashboard's store (else its seed CSVs)."""
+    if paths:
+        return pd.concat([read_weights(p) for p in paths], ignore_index=True)
+    if os.path.exists(db_path):
+        weights = WeightsRepository(db_path).all()
+        if not weights.empty:
+            return weights
+    return pd.concat([read_weights(PRESET_WEIGHTS), read_weights(CUSTOM_WEIGHTS)], ignore_index=True)
+
+
+def build_pipeline(df: pd.DataFrame, actions: pd.DataFrame = None, pipeline: dict = None,
+                   guess_actions: bool = False):
+    """The preprocessing the dashboard would run: a saved pipeline, an Action table, or the guessed actions.
+
+    Returns ``None`` when no preprocessing is requested (the dashboard before Apply).
+    """
+    if pipeline is not None:
+        return PrepPipeline.from_dict(pipeline)
+    if actions is None and guess_actions:
+        actions = variable_summary(df)
+    if actions is None:
+        return None
+    if "Type" not in actions.columns:
+        # Bare Variable/Action tables take their types from the data, as the editor does
+        types = variable_summary(df).set_index("Variable")["Type"]
+        actions = actions.assign(Type=actions["Variable"].map(types))
+    return PrepPipeline.from_actions(actions).fit(df)
+
+
+def score_dataset(df: pd.DataFrame, weights: pd.DataFrame, models: list = None, years: list = YEARS,
+                  prep: PrepPipeline = None) -> pd.DataFrame:
+    """Long-format scores (identifiers, Model, Year, X, Y, Z) for every entity × year × model."""
+    processed = prep.transform(df) if prep is not None else df
+    tensor = score_tensor(processed, weights, years)
+    unknown = sorted(set(models or ()) - set(tensor.models))
+    if unknown:
+        raise KeyError(f"Models not found in weights: {unknown}")
+    scores = tensor.to_long(models).reset_index(drop=True)
+    # Entity-major rows: each entity's identifiers repeat once per (year, model)
+    rows = np.repeat(np.arange(len(df)), len(scores) // max(len(df), 1))
+    ids = [c for c in ID_COLUMNS if c in df.columns]
+    return pd.concat([df[ids].take(rows).reset_index(drop=True), scores], axis=1)
+
+
+def output_path(path: str, out_dir: str = OUTPUT_DIR) -> str:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(out_dir, f"{stem}-scores.parquet")
+
+
+def score_file(path: str, weights: pd.DataFrame, out_dir: str = OUTPUT_DIR, models: list = None,
+               years: list = YEARS, actions: pd.DataFrame = None, pipeline: dict = None,
+               guess_actions: bool = False) -> dict:
+    """Load, preprocess and score one dataset, writing ``{stem}-scores.parquet`` atomically."""
+    start = time.perf_counter()
+    df = load_dataset(path)
+    prep = build_pipeline(df, actions, pipeline, guess_actions)
+    scores = score_dataset(df, weights, models, years, prep)
+
+    target = output_path(path, out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    tmp = f"{target}.tmp"
+    scores.to_parquet(tmp, index=False, compression=COMPRESSION)
+    os.replace(tmp, target)
+    return {
+        "input": path,
+        "output": target,
+        "rows": len(scores),
+        "skipped": [reason for _, reason in prep.skipped] if prep is not None else [],
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def run_batch(paths: list, weights: pd.DataFrame, out_dir: str = OUTPUT_DIR, workers: int = 0, **options) -> list:
+    """Score every input file; with ``workers > 0`` files are scored in a process pool.
+
+    Within a file all models × years are one matrix product per year, so the
+    pool parallelises across input files.
+    """
+    targets = [output_path(p, out_dir) for p in paths]
+    clashes = sorted({t for t in targets if targets.count(t) > 1})
+    if clashes:
+        raise ValueError(f"Inputs would overwrite each other's output: {clashes}")
+    if workers and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(score_file, p, weights, out_dir, **options) for p in paths]
+            return [f.result() for f in futures]
+    return [score_file(p, weights, out_dir, **options) for p in paths]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Score datasets under every model and year.")
+    parser.add_argument("inputs", nargs="*", default=[os.path.join("data", "ALL_RAW.csv")],
+                        help="Dataset CSVs (default: data/ALL_RAW.csv)")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="Output directory for *-scores.parquet")
+    parser.add_argument("--weights", nargs="+", help="Weight CSVs (default: the dashboard's weights store)")
+    parser.add_argument("--models", nargs="+", help="Only these models (default: all)")
+    parser.add_argument("--years", nargs="+", type=int, default=YEARS)
+    prep = parser.add_mutually_exclusive_group()
+    prep.add_argument("--actions", help="Variable/Action CSV (as edited in Data Preparation)")
+    prep.add_argument("--pipeline", help="Fitted pipeline JSON (PrepPipeline.to_dict) to re-apply without refitting")
+    prep.add_argument("--guess-actions", action="store_true", help="Apply the suggested Action table")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 runs in-process)")
+    args = parser.parse_args(argv)
+
+    options = {"models": args.models, "years": args.years, "guess_actions": args.guess_actions}
+    if args.actions:
+        options["actions"] = pd.read_csv(args.actions, encoding="utf-8-sig")
+    if args.pipeline:
+        with open(args.pipeline, encoding="utf-8") as f:
+            options["pipeline"] = json.load(f)
+
+    try:
+        results = run_batch(args.inputs, load_weights(args.weights), args.out, args.workers, **options)
+    except (KeyError, ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    for result in results:
+        print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""Dashboard figures: quadrant bubble chart (WebGL + level of detail) and cached Results Drivers charts."""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from .data import frame_fingerprint
+
+# Above this many points the chart switches from SVG to WebGL (scattergl)
+WEBGL_THRESHOLD = 1500
+# Above this many points inside the view window, points are binned on a grid
+MAX_POINTS = 5000
+# Finest grid side used when binning
+GRID_BINS = 120
+
+_FLOAT_COLUMNS = ["X", "Y", "Z", "Size"]
+
+
+def bubble_points(data: pd.DataFrame, axis_scores: pd.DataFrame) -> pd.DataFrame:
+    """Chart rows (X/Y/Z/Size/Category/Label) for entity scores, stored as float32."""
+    points = pd.DataFrame({
+        "X": axis_scores["X"],
+        "Y": axis_scores["Y"],
+        "Z": axis_scores["Z"],
+        "Category": data["Region"].astype(str) if "Region" in data.columns else "All",
+        "Label": data["Country"].astype(str) if "Country" in data.columns else data.index.astype(str),
+    })
+    # Bubble size must be non-negative; keep Z itself for hover
+    points["Size"] = points["Z"] - points["Z"].min() + 1
+    return compact(points)
+
+
+def compact(points: pd.DataFrame) -> pd.DataFrame:
+    """float32 coordinates: Plotly ships numpy arrays as binary (base64) typed arrays, so this halves the payload."""
+    cols = [c for c in _FLOAT_COLUMNS if c in points.columns]
+    return points.astype({c: np.float32 for c in cols})
+
+
+def symmetric_limit(points: pd.DataFrame, default: float = 50.0) -> float:
+    """Half-width of a view centred on the quadrant zero lines that contains every point."""
+    if points.empty:
+        return default
+    extent = float(np.nanmax(np.abs(points[["X", "Y"]].to_numpy(dtype=float))))
+    return extent * 1.1 if np.isfinite(extent) and extent > 0 else default
+
+
+def level_of_detail(points: pd.DataFrame, x_range=None, y_range=None,
+                    max_points: int = MAX_POINTS, bins: int = GRID_BINS) -> tuple:
+    """Clip to the view window and, if still too dense, aggregate per Category on a grid.
+
+    Returns ``(points, binned)``. Binned rows carry the members' mean position and
+    Z, summed Size and a ``Count``; narrowing the window refines back to raw points.
+    The grid starts at most ``bins`` cells a side and is coarsened until there are
+    at most ``max_points`` rows; a grid of ``√(max_points / categories)`` a side
+    always fits, short of more categories than ``max_points`` (one row each).
+    """
+    view = points
+    if x_range is not None:
+        view = view[view["X"].between(*x_range)]
+    if y_range is not None:
+        view = view[view["Y"].between(*y_range)]
+    if len(view) <= max_points:
+        return view, False
+
+    x0, x1 = x_range if x_range is not None else (view["X"].min(), view["X"].max())
+    y0, y1 = y_range if y_range is not None else (view["Y"].min(), view["Y"].max())
+    fx = (view["X"].to_numpy() - x0) / max(x1 - x0, 1e-12)
+    fy = (view["Y"].to_numpy() - y0) / max(y1 - y0, 1e-12)
+
+    categories = max(view["Category"].nunique(), 1)
+    fits = max(1, int(np.sqrt(max_points / categories)))
+    side = max(fits, min(bins, int(np.sqrt(max_points))))
+    while True:
+        binned = _bin_points(view, fx, fy, side)
+        if len(binned) <= max_points or side <= fits:
+            break
+        # Occupied cells shrink roughly with the cell count
+        side = max(fits, int(side * np.sqrt(max_points / len(binned))))
+    return compact(binned), True
+
+
+def _bin_points(view: pd.DataFrame, fx: np.ndarray, fy: np.ndarray, side: int) -> pd.DataFrame:
+    """One row per occupied (Category, cell) of a ``side`` × ``side`` grid over the unit-scaled ``fx``/``fy``."""
+    ix = np.clip((fx * side).astype(np.int32), 0, side - 1)
+    iy = np.clip((fy * side).astype(np.int32), 0, side - 1)
+    grouped = view.assign(_cell=ix * side + iy).groupby(["Category", "_cell"], observed=True, sort=False)
+    binned = grouped.agg(
+        X=("X", "mean"), Y=("Y", "mean"), Z=("Z", "mean"), Size=("Size", "sum"),
+        Count=("X", "size"), Label=("Label", "first"),
+    ).reset_index().drop(columns="_cell")
+    many = binned["Count"] > 1
+    binned.loc[many, "Label"] = binned.loc[many, "Count"].astype(str) + " entities"
+    return binned
+
+
+def bubble_figure(points: pd.DataFrame, title: str = "Interactive Bubble Chart (Quadrants)", height: int = 800,
+                  x_range=None, y_range=None, webgl_threshold: int = WEBGL_THRESHOLD):
+    """Quadrant bubble chart; SVG for small sets, WebGL above ``webgl_threshold`` points."""
+    # Symmetric quadrant range around the zero lines
+    if x_range is None or y_range is None:
+        axis_lim = symmetric_limit(points)
+        x_range = x_range or (-axis_lim, axis_lim)
+        y_range = y_range or (-axis_lim, axis_lim)
+
+    hover = {"Z": True, "Size": False}
+    if "Count" in points.columns:
+        hover["Count"] = True
+
+    # Create bubble chart
+    fig = px.scatter(
+        points,
+        x="X", y="Y", size="Size", color="Category" if "Category" in points.columns else None,
+        hover_name="Label", hover_data=hover, custom_data=["Label"], size_max=40,
+        render_mode="webgl" if len(points) > webgl_threshold else "svg",
+    )
+
+    # Update layout for quadrants
+    fig.update_layout(
+        title=title,
+        xaxis=dict(
+            range=list(x_range),
+            zeroline=True,
+            zerolinewidth=2,
+            zerolinecolor='gray',
+            title="X Axis",
+            showgrid=False
+        ),
+        yaxis=dict(
+            range=list(y_range),
+            zeroline=True,
+            zerolinewidth=2,
+            zerolinecolor='gray',
+            title="Y Axis",
+            showgrid=False
+        ),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=height,
+    )
+    return fig
+
+
+# ---- Results Drivers figures (built once per input, dark template applied at build time) ----
+DARK_TEMPLATE = "plotly_dark"
+
+
+def map_figure(map_df: pd.DataFrame, height: int = 420):
+    # plotly >= 5.24 renders maps with MapLibre (scatter_map); older releases only have scatter_mapbox
+    if hasattr(px, "scatter_map"):
+        fig = px.scatter_map(
+            map_df, lat="lat", lon="lon", size="value", color="Region",
+            hover_name="Region", zoom=3, height=height, template=DARK_TEMPLATE
+        )
+        fig.update_layout(map_style="open-street-map", margin=dict(l=0, r=0, t=0, b=0))
+    else:
+        fig = px.scatter_mapbox(
+            map_df, lat="lat", lon="lon", size="value", color="Region",
+            hover_name="Region", zoom=3, height=height, template=DARK_TEMPLATE
+        )
+        fig.update_layout(mapbox_style="open-street-map", margin=dict(l=0, r=0, t=0, b=0))
+    return fig
+
+
+def bar_figure(bar_df: pd.DataFrame, height: int = 420):
+    fig = px.bar(
+        bar_df, x="Driver", y="Contribution", text_auto=".3g",
+        color="Axis" if "Axis" in bar_df.columns else None,
+        title=None, template=DARK_TEMPLATE
+    )
+    fig.update_traces(textposition="outside")
+    fig.update_layout(yaxis_title="Contribution", xaxis_title="Driver", height=height)
+    return fig
+
+
+def line_figure(line_df: pd.DataFrame, height: int = 420, y_title: str = "Value"):
+    """Year/Value series per Kind (Observed / Fitted / Projected); fits are dashed."""
+    fig = px.line(
+        line_df, x="Year", y="Value", color="Kind", line_dash="Kind", markers=True,
+        title=None, template=DARK_TEMPLATE
+    )
+    fig.update_layout(yaxis_title=y_title, xaxis_title="Year", height=height, xaxis=dict(dtick=1))
+    return fig
+
+
+def pie_figure(pie_df: pd.DataFrame, height: int = 420):
+    fig = px.pie(
+        pie_df, names="Category", values="Share", hole=0.3, template=DARK_TEMPLATE
+    )
+    fig.update_layout(height=height)
+    return fig
+
+
+class FigureCache:
+    """Process-wide LRU of built figures keyed on (builder, input-frame hash, layout options).
+
+    Cached figures are shared between sessions and reruns, so callers must not
+    mutate them; apply any styling inside the builder.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, builder, frame: pd.DataFrame, **options):
+        key = (builder.__module__, builder.__qualname__, frame_fingerprint(frame), repr(sorted(options.items())))
+        with self._lock:
+            fig = self._figures.get(key)
+            if fig is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                return fig
+
+        fig = builder(frame, **options)
+        with self._lock:
+            self.misses += 1
+            self._figures[key] = fig
+            while len(self._figures) > self.max_entries:
+                self._figures.popitem(last=False)
+        return fig
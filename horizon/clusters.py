@@ -0,0 +1,97 @@
+"""Entity segmentation over axis scores: quadrants, or k-means clusters (mini-batch for large sets)."""
+import numpy as np
+import pandas as pd
+
+from .sensitivity import QUADRANTS, quadrant_codes
+
+# Above this many points k-means switches from full Lloyd iterations to mini-batches
+MINIBATCH_THRESHOLD = 10_000
+BATCH_SIZE = 2048
+
+
+def quadrant_labels(scores: pd.DataFrame) -> pd.Series:
+    """Quadrant name (e.g. ``"X+ Y−"``) per entity from its X/Y scores."""
+    codes = quadrant_codes(scores[["X", "Y"]].to_numpy(dtype=np.float64))
+    return pd.Series(np.asarray(QUADRANTS)[codes], index=scores.index, name="Quadrant")
+
+
+def _sq_distances(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    sq = (points ** 2).sum(axis=1)[:, None] - 2 * points @ centers.T + (centers ** 2).sum(axis=1)[None, :]
+    return np.maximum(sq, 0)
+
+
+def _assign(points: np.ndarray, centers: np.ndarray, block_rows: int = 65_536) -> np.ndarray:
+    return np.concatenate([
+        _sq_distances(points[i:i + block_rows], centers).argmin(axis=1)
+        for i in range(0, len(points), block_rows)
+    ]) if len(points) else np.empty(0, dtype=np.intp)
+
+
+def _kmeans_plus_plus(points: np.ndarray, k: int, rng) -> np.ndarray:
+    """k-means++ seeding: each new center drawn with probability ∝ squared distance to the nearest one."""
+    centers = [points[rng.integers(len(points))]]
+    closest = _sq_distances(points, np.asarray(centers))[:, 0]
+    for _ in range(1, k):
+        total = closest.sum()
+        pick = rng.choice(len(points), p=closest / total) if total > 0 else rng.integers(len(points))
+        centers.append(points[pick])
+        closest = np.minimum(closest, _sq_distances(points, points[pick:pick + 1])[:, 0])
+    return np.asarray(centers)
+
+
+def kmeans(points: np.ndarray, k: int, max_iter: int = 100, tol: float = 1e-4, seed: int = 0,
+           minibatch_threshold: int = MINIBATCH_THRESHOLD, batch_size: int = BATCH_SIZE) -> tuple:
+    """``(labels, centers)`` of k-means on ``points`` (entities × dims).
+
+    Small sets run full Lloyd iterations; above ``minibatch_threshold`` points
+    each iteration updates the centers from a random batch with per-center
+    learning rates (Sculley's mini-batch k-means), then assigns every point once.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    k = max(1, min(k, len(points)))
+    rng = np.random.default_rng(seed)
+    sample = points
+    if len(points) > minibatch_threshold:
+        sample = points[rng.choice(len(points), minibatch_threshold, replace=False)]
+    centers = _kmeans_plus_plus(sample, k, rng)
+
+    if len(points) <= minibatch_threshold:
+        for _ in range(max_iter):
+            labels = _assign(points, centers)
+            counts = np.bincount(labels, minlength=k)
+            sums = np.zeros_like(centers)
+            np.add.at(sums, labels, points)
+            moved = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], centers)
+            shift = np.abs(moved - centers).max()
+            centers = moved
+            if shift < tol:
+                break
+    else:
+        seen = np.zeros(k)
+        for _ in range(max_iter):
+            batch = points[rng.integers(len(points), size=batch_size)]
+            labels = _assign(batch, centers)
+            counts = np.bincount(labels, minlength=k)
+            sums = np.zeros_like(centers)
+            np.add.at(sums, labels, batch)
+            seen += counts
+            step = np.divide(sums - counts[:, None] * centers, seen[:, None], out=np.zeros_like(centers),
+                             where=seen[:, None] > 0)
+            centers = centers + step
+            if np.abs(step).max() < tol:
+                break
+
+    return _assign(points, centers), centers
+
+
+def cluster_labels(scores: pd.DataFrame, k: int, axes: list = ("X", "Y"), seed: int = 0) -> pd.Series:
+    """k-means segment per entity on standardised ``axes`` scores, named "Cluster 1".. by center X."""
+    points = scores[list(axes)].to_numpy(dtype=np.float64)
+    std = points.std(axis=0)
+    points = (points - points.mean(axis=0)) / np.where(std > 0, std, 1.0)
+    labels, centers = kmeans(np.nan_to_num(points), k, seed=seed)
+    # Stable names regardless of seeding order: clusters numbered left to right
+    rank = np.empty(len(centers), dtype=np.intp)
+    rank[np.argsort(centers[:, 0], kind="stable")] = np.arange(len(centers))
+    names = np.array([f"Cluster {i + 1}" for i in range(len(centers))])
+    return pd.Series(names[rank[labels]], index=scores.index, name="Cluster")
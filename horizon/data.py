@@ -0,0 +1,112 @@
+"""Dataset loading: header normalisation, dtype downcasting and a Parquet side-cache."""
+import hashlib
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = os.path.join("data", ".cache")
+
+# Identifier columns stored as categoricals rather than free text
+CATEGORY_COLUMNS = ["Country", "Region"]
+
+_INT32 = np.iinfo(np.int32)
+
+
+def file_fingerprint(path: str) -> str:
+    """Cheap change-detection key for a file: absolute path + mtime + size."""
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}"
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def derive_fingerprint(parent: str, payload) -> str:
+    """Fingerprint of data derived from ``parent`` by a deterministic step described by ``payload``."""
+    return hashlib.sha1(f"{parent}|{payload!r}".encode()).hexdigest()[:16]
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a (small) frame, e.g. a weights table."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    key = f"{list(df.columns)}|{row_hashes.tobytes().hex()}"
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def normalise_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Strip stray whitespace from headers (e.g. ``"Y_Criminality_avg "``)."""
+    cols = [str(c).strip() for c in df.columns]
+    dupes = sorted({c for c in cols if cols.count(c) > 1})
+    if dupes:
+        raise ValueError(f"Duplicate columns after stripping whitespace: {dupes}")
+    df.columns = cols
+    return df
+
+
+def downcast(df: pd.DataFrame, category_columns=CATEGORY_COLUMNS) -> pd.DataFrame:
+    """Shrink dtypes in place: float64 → float32, int64 → int32 (when it fits), ids → category."""
+    for col in df.columns:
+        s = df[col]
+        if col in category_columns:
+            df[col] = s.astype("category")
+        elif pd.api.types.is_float_dtype(s.dtype):
+            df[col] = s.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype):
+            if s.empty or (s.min() >= _INT32.min and s.max() <= _INT32.max):
+                df[col] = s.astype(np.int32)
+    return df
+
+
+def read_csv(source, **kwargs) -> pd.DataFrame:
+    """Parse a CSV path or buffer into the dashboard's normalised, downcast layout."""
+    return downcast(normalise_columns(pd.read_csv(source, **kwargs)))
+
+
+def _cache_slot(path: str) -> str:
+    """Cache name prefix for one source file: its stem plus a hash of its absolute path."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    where = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:8]
+    return f"{stem}-{where}"
+
+
+def _cache_path(path: str, fingerprint: str, cache_dir: str) -> str:
+    return os.path.join(cache_dir, f"{_cache_slot(path)}-{fingerprint}.parquet")
+
+
+def _drop_stale(path: str, keep: str, cache_dir: str) -> None:
+    """Remove older side-caches of ``path`` (and only of ``path``)."""
+    pattern = re.compile(rf"^{re.escape(_cache_slot(path))}-[0-9a-f]{{16}}\.parquet$")
+    for name in os.listdir(cache_dir):
+        full = os.path.join(cache_dir, name)
+        if pattern.match(name) and full != keep:
+            try:
+                os.remove(full)
+            except OSError:
+                pass
+
+
+def load_dataset(path: str, cache_dir: str = CACHE_DIR) -> pd.DataFrame:
+    """Load a CSV, reusing a Parquet copy keyed on the file fingerprint when one exists."""
+    fingerprint = file_fingerprint(path)
+    cached = _cache_path(path, fingerprint, cache_dir)
+
+    if os.path.exists(cached):
+        try:
+            return pd.read_parquet(cached)
+        except Exception:
+            # Corrupt or unreadable side-cache → fall back to the CSV
+            pass
+
+    df = read_csv(path)
+
+    # Best effort: a missing Parquet engine or read-only disk just means no side-cache
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{cached}.tmp"
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, cached)
+        _drop_stale(path, cached, cache_dir)
+    except (ImportError, OSError, ValueError):
+        pass
+
+    return df
@@ -0,0 +1,72 @@
+"""Per-entity driver decomposition: which weighted variables push each axis score up or down."""
+import numpy as np
+import pandas as pd
+
+from .scoring import AXES
+
+TOP_K = 5
+
+DRIVER_COLUMNS = ["Driver", "Axis", "Variable", "Contribution"]
+
+
+def top_drivers(contributions: np.ndarray, k: int = TOP_K) -> tuple:
+    """Column indices of each row's ``k`` largest and ``k`` smallest contributions, ordered by size.
+
+    Uses ``argpartition`` (O(terms) per row) and only sorts the ``k`` picked
+    entries, so cost stays linear in the number of terms.
+    """
+    n_terms = contributions.shape[1]
+    k = min(k, n_terms)
+    if k == 0:
+        empty = np.empty((len(contributions), 0), dtype=np.intp)
+        return empty, empty
+
+    def pick(signed):
+        if k < n_terms:
+            idx = np.argpartition(signed, k - 1, axis=1)[:, :k]
+        else:
+            idx = np.broadcast_to(np.arange(n_terms), signed.shape)
+        order = np.argsort(np.take_along_axis(signed, idx, axis=1), axis=1, kind="stable")
+        return np.take_along_axis(idx, order, axis=1)
+
+    return pick(-contributions), pick(contributions)
+
+
+class DriverDecomposition:
+    """Weight × value contribution of every weighted (axis, variable) term for every entity.
+
+    Contributions of one axis sum to that axis' score, so the top positive and
+    negative terms explain where an entity lands on the chart.
+    """
+
+    def __init__(self, index: pd.Index, axes: np.ndarray, variables: list, contributions: np.ndarray,
+                 top_k: int = TOP_K):
+        self.index = index
+        self.axes = axes            # axis name per term
+        self.variables = variables  # variable name per term
+        self.contributions = contributions  # (entities, terms)
+        self.positive, self.negative = top_drivers(contributions, top_k)
+
+    @classmethod
+    def from_inputs(cls, values: np.ndarray, weights: np.ndarray, variables: list, index: pd.Index,
+                    top_k: int = TOP_K) -> "DriverDecomposition":
+        """Decompose ``values`` (entities × variables) under ``weights`` (axes × variables) in one broadcast."""
+        axis_idx, var_idx = np.nonzero(weights)
+        contributions = values[:, var_idx] * weights[axis_idx, var_idx]
+        return cls(
+            index, np.asarray(AXES)[axis_idx], [variables[j] for j in var_idx],
+            contributions.astype(np.float32), top_k,
+        )
+
+    def drivers(self, entity) -> pd.DataFrame:
+        """Top positive then top negative drivers of one entity (an index label)."""
+        row = self.index.get_loc(entity)
+        contributions = self.contributions[row]
+        terms = [j for j in self.positive[row] if contributions[j] > 0]
+        terms += [j for j in self.negative[row][::-1] if contributions[j] < 0]
+        return pd.DataFrame({
+            "Driver": [f"{self.variables[j]} ({self.axes[j]})" for j in terms],
+            "Axis": [self.axes[j] for j in terms],
+            "Variable": [self.variables[j] for j in terms],
+            "Contribution": contributions[terms].astype(np.float64),
+        }, columns=DRIVER_COLUMNS)
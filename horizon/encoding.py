@@ -0,0 +1,103 @@
+"""Categorical encoding with stored code dictionaries, so codes stay stable across extracts."""
+import numpy as np
+import pandas as pd
+
+# Code for values missing from the stored dictionary (and for missing text values)
+UNKNOWN_CODE = -1
+
+
+def code_dtype(n_categories: int):
+    """Smallest signed integer dtype holding codes ``0..n-1`` plus :data:`UNKNOWN_CODE`."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _numeric_labels(uniques) -> pd.Index:
+    """Text form of numeric values, with integral floats written as ints.
+
+    An int column that gains a missing value in a later extract is read as
+    float; writing ``1.0`` as ``"1"`` keeps its values on the stored labels.
+    """
+    text = np.asarray(uniques.astype(str), dtype=object)
+    if uniques.dtype.kind == "f":
+        values = np.asarray(uniques, dtype=np.float64)
+        integral = np.isfinite(values) & (values == np.trunc(values))
+        text[integral] = [str(int(v)) for v in values[integral]]
+    return pd.Index(text.tolist(), dtype=object)
+
+
+def _uniques(s: pd.Series) -> tuple:
+    """``(codes, labels, uniques)`` with ``labels[codes]`` reproducing ``s`` (code -1 = missing).
+
+    Factorizing first means the hash lookup against a dictionary (and, for
+    numerics, the string conversion) only touches distinct values.
+    """
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return s.cat.codes.to_numpy(), pd.Index(s.cat.categories), s.cat.categories
+    codes, uniques = pd.factorize(s)
+    if pd.api.types.is_numeric_dtype(s.dtype):
+        # Low-cardinality numerics are encoded by their string form
+        return codes, _numeric_labels(uniques), uniques
+    return codes, pd.Index(uniques), uniques
+
+
+class CategoryEncoder:
+    """Per-column category dictionaries, fitted once and re-applied to new data.
+
+    Codes index into the stored dictionary (so they do not depend on which values
+    a later file happens to contain), use the smallest integer dtype that fits,
+    and values not in the dictionary get :data:`UNKNOWN_CODE`.
+    """
+
+    def __init__(self, categories: dict = None):
+        self.categories = {c: list(v) for c, v in (categories or {}).items()}
+        self._lookup = {c: pd.Index(v) for c, v in self.categories.items()}
+
+    @property
+    def columns(self) -> list:
+        return list(self.categories)
+
+    def fit(self, df: pd.DataFrame, columns: list) -> "CategoryEncoder":
+        for col in columns:
+            s = df[col]
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                labels = s.cat.categories
+            else:
+                codes, labels, _ = _uniques(s)
+                labels = labels[np.unique(codes[codes >= 0])].sort_values()
+            self.categories[col] = labels.tolist()
+            self._lookup[col] = pd.Index(self.categories[col])
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Codes for every encoded column, built in one pass over each column's distinct values."""
+        out = {}
+        for col, lookup in self._lookup.items():
+            codes, labels, uniques = _uniques(df[col])
+            found = lookup.get_indexer(labels)
+            if uniques.dtype.kind == "f":
+                # Dictionaries fitted before integral floats were written as ints hold e.g. "1.0"
+                found = np.where(found < 0, lookup.get_indexer(pd.Index(uniques.astype(str).tolist())), found)
+            mapping = np.append(found, UNKNOWN_CODE)  # last slot: missing (-1)
+            out[col] = mapping[codes].astype(code_dtype(len(lookup)))
+        return pd.DataFrame(out, index=df.index)
+
+    def decode(self, codes: pd.DataFrame) -> pd.DataFrame:
+        """Map codes back to labels (unknown codes → NaN)."""
+        return pd.DataFrame({
+            col: pd.Categorical.from_codes(codes[col].to_numpy(), categories=self.categories[col])
+            for col in self.categories if col in codes.columns
+        }, index=codes.index)
+
+    def unknown_counts(self, codes: pd.DataFrame) -> dict:
+        """Rows per column whose value was not in the stored dictionary (or missing)."""
+        return {col: int((codes[col] == UNKNOWN_CODE).sum()) for col in self.categories if col in codes.columns}
+
+    def to_dict(self) -> dict:
+        return {c: list(v) for c, v in self.categories.items()}
+
+    @classmethod
+    def from_dict(cls, categories: dict) -> "CategoryEncoder":
+        return cls(categories)
@@ -0,0 +1,121 @@
+"""Processed-data export: compressed binary/CSV formats, written atomically (run as a pool job)."""
+import gzip
+import json
+import os
+import threading
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .jobs import report_progress
+
+# Rows per write step (progress is reported between steps)
+CHUNK_ROWS = 100_000
+
+# label → (file extension, writer key)
+FORMATS = {
+    "Parquet (zstd)": (".parquet", "parquet"),
+    "Feather (lz4)": (".feather", "feather"),
+    "CSV (gzip)": (".csv.gz", "csv.gz"),
+    "CSV": (".csv", "csv"),
+}
+
+
+def _strip_extension(name: str) -> str:
+    for ext in sorted((e for e, _ in FORMATS.values()), key=len, reverse=True):
+        if name.lower().endswith(ext):
+            return name[:-len(ext)]
+    return name
+
+
+def export_path(directory: str, name: str, fmt: str) -> str:
+    """``directory/name`` with the format's extension (any known extension on ``name`` is replaced)."""
+    return os.path.join(directory, _strip_extension(name) + FORMATS[fmt][0])
+
+
+def sidecar_path(path: str) -> str:
+    """``data/x.csv.gz`` → ``data/x.pipeline.json``."""
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f"{_strip_extension(name)}.pipeline.json")
+
+
+def _chunks(n_rows: int, chunk_rows: int):
+    return [(i, min(i + chunk_rows, n_rows)) for i in range(0, max(n_rows, 1), chunk_rows)]
+
+
+def _write_parquet(df, path, progress, chunk_rows):
+    steps = _chunks(len(df), chunk_rows)
+    writer = None
+    try:
+        for k, (i, j) in enumerate(steps):
+            table = pa.Table.from_pandas(df.iloc[i:j], preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression="zstd")
+            writer.write_table(table.cast(writer.schema))
+            progress((k + 1) / len(steps))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _write_feather(df, path, progress, chunk_rows):
+    # Feather is one columnar write; progress jumps from 0 to 1
+    df.reset_index(drop=True).to_feather(path, compression="lz4")
+    progress(1.0)
+
+
+def _write_csv(df, path, progress, chunk_rows, compress=False):
+    steps = _chunks(len(df), chunk_rows)
+    opener = (lambda p: gzip.open(p, "wt", encoding="utf-8", newline="", compresslevel=6)) if compress \
+        else (lambda p: open(p, "w", encoding="utf-8", newline=""))
+    with opener(path) as f:
+        for k, (i, j) in enumerate(steps):
+            df.iloc[i:j].to_csv(f, index=False, header=k == 0)
+            progress((k + 1) / len(steps))
+
+
+_WRITERS = {
+    "parquet": _write_parquet,
+    "feather": _write_feather,
+    "csv.gz": lambda df, path, progress, chunk_rows: _write_csv(df, path, progress, chunk_rows, compress=True),
+    "csv": _write_csv,
+}
+
+
+def write_atomic(df, path: str, fmt: str, progress=lambda fraction: None, chunk_rows: int = CHUNK_ROWS) -> int:
+    """Write ``df`` to ``path`` via a hidden temp file in the same directory, then rename.
+
+    A reader listing the directory never sees a partial file. Returns the size in bytes.
+    """
+    directory, name = os.path.split(path)
+    os.makedirs(directory or ".", exist_ok=True)
+    tmp = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _WRITERS[FORMATS[fmt][1]](df, tmp, progress, chunk_rows)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return os.path.getsize(path)
+
+
+def write_json_atomic(payload, path: str) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp, path)
+
+
+def export_frame(df, path: str, fmt: str, sidecar: dict = None, chunk_rows: int = CHUNK_ROWS) -> dict:
+    """Write ``df`` atomically, then ``sidecar`` (e.g. the fitted pipeline) as ``<stem>.pipeline.json``.
+
+    Meant to run in the job pool: progress goes to :func:`report_progress`, and
+    a cancelled export stops between chunks without leaving a partial file.
+    """
+    size = write_atomic(df, path, fmt, report_progress, chunk_rows)
+    written_sidecar = None
+    if sidecar is not None:
+        written_sidecar = sidecar_path(path)
+        write_json_atomic(sidecar, written_sidecar)
+    return {"path": path, "format": fmt, "rows": len(df), "bytes": size, "sidecar_path": written_sidecar}
@@ -0,0 +1,176 @@
+"""Bounded-memory, chunked CSV ingestion for uploads."""
+import os
+
+import numpy as np
+import pandas as pd
+
+from .data import CATEGORY_COLUMNS, downcast, normalise_columns
+
+CHUNK_ROWS = 50_000
+# Parsed uploads larger than this are sampled (or rejected); override with HORIZON_UPLOAD_BUDGET_MB
+MEMORY_BUDGET_MB = float(os.environ.get("HORIZON_UPLOAD_BUDGET_MB", 256))
+# "sample" keeps a systematic row sample within the budget, "reject" refuses the file
+OVER_BUDGET = os.environ.get("HORIZON_UPLOAD_OVER_BUDGET", "sample")
+
+AXIS_PREFIXES = ("X_", "Y_", "Z_")
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+class RunningStats:
+    """Streaming count/min/max/mean/std per numeric column, merged chunk by chunk (Chan et al.).
+
+    A column counts as numeric while every chunk so far parsed it as numbers; one
+    that holds text in a later chunk (e.g. empty at first) becomes categorical and
+    its running statistics are dropped.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.columns = None
+        self.numeric = []
+        self.missing = None
+        self.count = self.mean = self.m2 = self.min = self.max = None
+
+    def update(self, chunk: pd.DataFrame, numeric: list) -> None:
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            self.numeric = list(numeric)
+            k = len(self.numeric)
+            self.missing = np.zeros(len(self.columns), dtype=np.int64)
+            self.count = np.zeros(k)
+            self.mean = np.zeros(k)
+            self.m2 = np.zeros(k)
+            self.min = np.full(k, np.inf)
+            self.max = np.full(k, -np.inf)
+        else:
+            numeric = set(numeric)
+            keep = np.array([c in numeric for c in self.numeric], dtype=bool)
+            if not keep.all():
+                self.numeric = [c for c, k in zip(self.numeric, keep) if k]
+                self.count, self.mean, self.m2 = self.count[keep], self.mean[keep], self.m2[keep]
+                self.min, self.max = self.min[keep], self.max[keep]
+
+        self.rows += len(chunk)
+        self.missing += chunk[self.columns].isna().sum().to_numpy()
+        if not self.numeric:
+            return
+
+        values = chunk[self.numeric].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        n_b = valid.sum(axis=0)
+        has = n_b > 0
+        mean_b = np.divide(np.where(valid, values, 0.0).sum(axis=0), n_b, out=np.zeros_like(self.mean), where=has)
+        dev = np.where(valid, values - mean_b, 0.0)
+        m2_b = (dev * dev).sum(axis=0)
+
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.mean = np.where(has, self.mean + delta * n_b / n, self.mean)
+            self.m2 = np.where(has, self.m2 + m2_b + delta * delta * self.count * n_b / n, self.m2)
+        self.count = n
+        self.min = np.minimum(self.min, np.where(valid, values, np.inf).min(axis=0, initial=np.inf))
+        self.max = np.maximum(self.max, np.where(valid, values, -np.inf).max(axis=0, initial=-np.inf))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Variable/Type/Min/Max/Mean/Std/Missing, in the layout of the Data Preparation summary."""
+        out = pd.DataFrame({"Variable": self.columns or []})
+        out["Type"] = ["Numeric" if c in self.numeric else "Categorical" for c in out["Variable"]]
+        for name in ["Min", "Max", "Mean", "Std"]:
+            out[name] = np.nan
+        if self.columns and self.numeric:
+            has = self.count > 0
+            rows = out["Variable"].isin(self.numeric).to_numpy()
+            out.loc[rows, "Min"] = np.where(has, self.min, np.nan)
+            out.loc[rows, "Max"] = np.where(has, self.max, np.nan)
+            out.loc[rows, "Mean"] = np.where(has, self.mean, np.nan)
+            # Population std (ddof=0), as in the Data Preparation summary
+            out.loc[rows, "Std"] = np.sqrt(np.divide(self.m2, self.count, out=np.full_like(self.m2, np.nan), where=has))
+        out["Missing"] = self.missing if self.missing is not None else []
+        return out
+
+
+class IngestResult:
+    def __init__(self, frame: pd.DataFrame, summary: pd.DataFrame, rows_read: int, sample_step: int,
+                 missing_columns: list, unexpected_columns: list, coerced: dict):
+        self.frame = frame
+        self.summary = summary
+        self.rows_read = rows_read
+        # Every ``sample_step``-th row was kept (1 → all rows)
+        self.sample_step = sample_step
+        self.missing_columns = missing_columns
+        self.unexpected_columns = unexpected_columns
+        # Expected-numeric column → number of non-numeric cells turned into NaN
+        self.coerced = coerced
+
+    @property
+    def sampled(self) -> bool:
+        return self.sample_step > 1
+
+
+def ingest_csv(source, expected_columns=None, chunk_rows: int = CHUNK_ROWS,
+               memory_budget_mb: float = MEMORY_BUDGET_MB, over_budget: str = OVER_BUDGET) -> IngestResult:
+    """Parse ``source`` in ``chunk_rows`` chunks, validating and summarising as it streams.
+
+    ``expected_columns`` are the axis (``X_``/``Y_``/``Z_``) columns the dashboard
+    knows; they are reported if absent and coerced to numeric if a chunk holds text.
+    Files with no axis columns at all are rejected. Once the kept rows exceed
+    ``memory_budget_mb``, either :class:`UploadTooLarge` is raised (``"reject"``) or
+    every other kept row is dropped and the sampling step doubles (``"sample"``);
+    statistics always cover every row.
+    """
+    budget = memory_budget_mb * 1024 * 1024
+    expected = [c for c in (expected_columns or [])]
+    stats = RunningStats()
+    kept, kept_bytes, step = [], 0, 1
+    missing, unexpected, coerced = [], [], {}
+
+    for chunk in pd.read_csv(source, chunksize=chunk_rows):
+        chunk = normalise_columns(chunk)
+
+        if stats.columns is None:
+            axis_cols = [c for c in chunk.columns if c.startswith(AXIS_PREFIXES)]
+            if not axis_cols:
+                raise ValueError("No X_/Y_/Z_ columns found; this does not look like a Horizon dataset.")
+            if expected:
+                missing = [c for c in expected if c not in chunk.columns]
+                unexpected = [c for c in axis_cols if c not in expected]
+        elif list(chunk.columns) != stats.columns:
+            raise ValueError("Column layout changed part-way through the file.")
+
+        # Axis columns must be numeric; stray text becomes NaN (and is counted)
+        for col in [c for c in chunk.columns if c.startswith(AXIS_PREFIXES)]:
+            if not pd.api.types.is_numeric_dtype(chunk[col].dtype):
+                as_num = pd.to_numeric(chunk[col], errors="coerce")
+                bad = int((as_num.isna() & chunk[col].notna()).sum())
+                if bad:
+                    coerced[col] = coerced.get(col, 0) + bad
+                chunk[col] = as_num
+
+        numeric = [c for c in chunk.columns if pd.api.types.is_numeric_dtype(chunk[c].dtype)]
+        stats.update(chunk, numeric)
+
+        chunk = downcast(chunk, category_columns=())
+        if step > 1:
+            chunk = chunk[chunk.index % step == 0]
+        kept.append(chunk)
+        kept_bytes += int(chunk.memory_usage(deep=True).sum())
+
+        while kept_bytes > budget:
+            if over_budget == "reject":
+                raise UploadTooLarge(
+                    f"Upload exceeds the {memory_budget_mb:g} MB memory budget after {stats.rows:,} rows."
+                )
+            step *= 2
+            kept = [c[c.index % step == 0] for c in kept]
+            kept_bytes = sum(int(c.memory_usage(deep=True).sum()) for c in kept)
+
+    if stats.columns is None:
+        raise ValueError("The uploaded file is empty.")
+
+    frame = pd.concat(kept) if kept else pd.DataFrame(columns=stats.columns)
+    frame = downcast(frame, category_columns=[c for c in CATEGORY_COLUMNS if c in frame.columns])
+    return IngestResult(frame, stats.to_frame(), stats.rows, step, missing, unexpected, coerced)
@@ -0,0 +1,161 @@
+"""Background job pool shared by every session of a server process.
+
+Jobs are keyed by what they compute, so a request identical to one already in
+flight gets the same handle instead of a second computation. Each caller owns a
+*group* (e.g. "apply" for one session); submitting a new key to a group
+supersedes its previous job, which is cancelled unless another group still
+waits on it. Work running in the pool reports progress, and notices
+cancellation, through :func:`report_progress`.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+
+# Threads, not processes: the heavy steps are NumPy/Arrow kernels that release the GIL,
+# and results (frames, fitted pipelines) stay in this process without pickling
+MAX_WORKERS = int(os.environ.get("HORIZON_WORKERS", min(4, os.cpu_count() or 1)))
+# Finished jobs kept for lookup by key
+MAX_FINISHED = 64
+
+_local = threading.local()
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def current_job():
+    """The job running on this thread, or ``None`` outside the pool."""
+    return getattr(_local, "job", None)
+
+
+def report_progress(fraction: float) -> None:
+    """Record progress of the current job and stop it if it was cancelled (no-op outside the pool)."""
+    job = current_job()
+    if job is None:
+        return
+    job.progress = float(fraction)
+    if job.cancel_requested:
+        raise JobCancelled(job.key)
+
+
+class Job:
+    """Handle on one submitted computation."""
+
+    def __init__(self, key, label: str = None):
+        self.key = key
+        self.label = label or str(key)
+        self.status = "queued"  # queued | running | done | failed | cancelled
+        self.progress = 0.0
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+        self.future = None
+        self._cancel = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self.status in ("queued", "running")
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def seconds(self) -> float:
+        return (self.finished or time.time()) - self.created
+
+    def cancel(self) -> None:
+        """Cancel if still queued; a running job stops at its next progress report."""
+        self._cancel.set()
+        if self.future is not None and self.future.cancel():
+            self.status = "cancelled"
+            self.finished = time.time()
+
+    def wait(self, timeout: float = None) -> "Job":
+        if self.future is not None:
+            wait_futures([self.future], timeout)
+        return self
+
+    def result(self, timeout: float = None):
+        """The job's return value (re-raises its error)."""
+        return self.future.result(timeout)
+
+
+class JobPool:
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="horizon-job")
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()  # key → Job
+        self._groups = {}           # group → key of its latest job
+
+    def submit(self, key, fn, *args, group: str = None, label: str = None, **kwargs) -> Job:
+        """Run ``fn(*args, **kwargs)`` in the pool, or join the identical in-flight job.
+
+        A job already asked to cancel is not joined; the key starts afresh.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or not job.running or job.cancel_requested:
+                job = Job(key, label)
+                self._jobs[key] = job
+                self._jobs.move_to_end(key)
+                job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+            if group is not None:
+                previous = self._groups.get(group)
+                self._groups[group] = key
+                if previous is not None and previous != key and previous not in self._groups.values():
+                    superseded = self._jobs.get(previous)
+                    if superseded is not None and superseded.running:
+                        superseded.cancel()
+            self._prune()
+        return job
+
+    def run(self, key, fn, *args, group: str = None, label: str = None, **kwargs):
+        """Submit and wait for the result (callers still share identical in-flight work)."""
+        return self.submit(key, fn, *args, group=group, label=label, **kwargs).result()
+
+    def get(self, key):
+        with self._lock:
+            return self._jobs.get(key)
+
+    def jobs(self) -> list:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def _run(self, job: Job, fn, args, kwargs):
+        if job.cancel_requested:
+            job.status = "cancelled"
+            job.finished = time.time()
+            raise JobCancelled(job.key)
+        job.status = "running"
+        _local.job = job
+        try:
+            result = fn(*args, **kwargs)
+        except JobCancelled:
+            job.status = "cancelled"
+            raise
+        except Exception as e:
+            job.error = str(e)
+            job.status = "failed"
+            raise
+        else:
+            job.progress = 1.0
+            job.status = "done"
+            return result
+        finally:
+            _local.job = None
+            job.finished = time.time()
+
+    def _prune(self) -> None:
+        finished = [k for k, j in self._jobs.items() if not j.running]
+        for key in finished[:max(0, len(finished) - MAX_FINISHED)]:
+            del self._jobs[key]
+
+    def shutdown(self, wait: bool = True) -> None:
+        for job in self.jobs():
+            job.cancel()
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,91 @@
+"""Nearest-neighbour search over entities' X/Y/Z profiles ("countries like this")."""
+import numpy as np
+import pandas as pd
+
+METRICS = ["cosine", "euclidean"]
+# Query rows per block in all-pairs search; a block's score matrix is BLOCK_ROWS × entities
+BLOCK_ROWS = 1024
+
+
+class NeighborIndex:
+    """Exact similarity search over z-scored variable profiles.
+
+    Each column is standardised (missing values sit at the column mean), so no
+    variable dominates by scale. Cosine search uses unit-normalised rows;
+    euclidean uses ``|a|² + |b|² - 2a·b``. Both are one matrix product per query
+    block; at this dimensionality (tens to hundreds of variables) a space-
+    partitioning tree would visit most leaves anyway.
+    """
+
+    def __init__(self, values: np.ndarray, columns: list, labels: pd.Index):
+        values = np.asarray(values, dtype=np.float64)
+        self.columns = list(columns)
+        self.labels = labels
+        with np.errstate(invalid="ignore"):
+            mean = np.nanmean(values, axis=0) if len(values) else np.zeros(values.shape[1])
+            std = np.nanstd(values, axis=0) if len(values) else np.ones(values.shape[1])
+        std = np.where(np.isfinite(std) & (std > 0), std, 1.0)
+        z = np.nan_to_num((values - np.nan_to_num(mean)) / std, nan=0.0)
+        self.vectors = z.astype(np.float32)
+        self.sq_norms = np.einsum("ij,ij->i", self.vectors, self.vectors)
+        norms = np.sqrt(self.sq_norms)
+        self.unit = np.divide(self.vectors, norms[:, None], out=np.zeros_like(self.vectors), where=norms[:, None] > 0)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, columns: list, label_column: str = "Country",
+                   labels: pd.Series = None) -> "NeighborIndex":
+        """Index ``columns`` of ``df``, labelled by ``labels`` (row order of ``df``) or else ``label_column``."""
+        if labels is None:
+            labels = df[label_column].astype(str) if label_column in df.columns else df.index.astype(str)
+        return cls(df[columns].to_numpy(dtype=np.float64, na_value=np.nan), columns, pd.Index(labels))
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def _scores(self, rows: np.ndarray, metric: str) -> np.ndarray:
+        """Higher is closer: cosine similarity, or negated euclidean distance."""
+        if metric == "cosine":
+            return self.unit[rows] @ self.unit.T
+        if metric == "euclidean":
+            sq = self.sq_norms[rows, None] + self.sq_norms[None, :] - 2 * (self.vectors[rows] @ self.vectors.T)
+            return -np.sqrt(np.maximum(sq, 0))
+        raise ValueError(f"Unknown metric '{metric}'; expected one of {METRICS}.")
+
+    def top_k(self, k: int = 10, metric: str = "cosine", rows: np.ndarray = None,
+              block_rows: int = BLOCK_ROWS) -> tuple:
+        """``(neighbours, scores)`` of shape ``(len(rows), k)``, nearest first, excluding each row itself.
+
+        Rows are processed in blocks so memory stays ``block_rows × entities``;
+        the k best per row come from ``argpartition``.
+        """
+        rows = np.arange(len(self)) if rows is None else np.asarray(rows)
+        k = max(0, min(k, len(self) - 1))
+        neighbours = np.empty((len(rows), k), dtype=np.intp)
+        best = np.empty((len(rows), k), dtype=np.float32)
+        for start in range(0, len(rows), block_rows):
+            block = rows[start:start + block_rows]
+            scores = self._scores(block, metric)
+            scores[np.arange(len(block)), block] = -np.inf  # never your own neighbour
+            if k == 0:
+                continue
+            idx = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top = np.take_along_axis(scores, idx, axis=1)
+            order = np.argsort(-top, axis=1, kind="stable")
+            neighbours[start:start + len(block)] = np.take_along_axis(idx, order, axis=1)
+            best[start:start + len(block)] = np.take_along_axis(top, order, axis=1)
+        return neighbours, best
+
+    def query(self, label: str, k: int = 10, metric: str = "cosine") -> pd.DataFrame:
+        """The ``k`` entities most like ``label``: Rank, label and Similarity (cosine) or Distance (euclidean)."""
+        matches = self.labels.get_indexer_for([label])
+        if len(matches) == 0 or matches[0] < 0:
+            raise KeyError(label)
+        row = matches[0]  # duplicate labels: first match
+        neighbours, scores = self.top_k(k, metric, rows=np.array([row]))
+        name = self.labels.name or "Entity"
+        column = "Similarity" if metric == "cosine" else "Distance"
+        return pd.DataFrame({
+            "Rank": np.arange(1, neighbours.shape[1] + 1),
+            name: self.labels[neighbours[0]],
+            column: scores[0] if metric == "cosine" else -scores[0],
+        })
@@ -0,0 +1,114 @@
+"""Fitted preprocessing pipeline compiled from the Data Preparation Action table."""
+import numpy as np
+import pandas as pd
+
+from .encoding import CategoryEncoder
+
+
+class PrepPipeline:
+    """Grouped Standardize/Encode steps with fitted parameters that can be re-applied.
+
+    ``fit`` learns per-column means/stds and category lists; ``transform`` applies
+    them to any frame with the same columns (e.g. next month's extract) without
+    refitting, so processed values stay comparable across runs.
+    """
+
+    def __init__(self, standardize=(), encode=()):
+        self.standardize = list(standardize)
+        self.encode = list(encode)
+        self.means = {}
+        self.stds = {}
+        self.encoder = CategoryEncoder()
+        self.skipped = []  # (column, reason)
+
+    @property
+    def categories(self) -> dict:
+        """Stored category dictionary per encoded column (code = position)."""
+        return self.encoder.categories
+
+    @classmethod
+    def from_actions(cls, actions: pd.DataFrame) -> "PrepPipeline":
+        """Compile the Variable/Type/Action editor table into grouped operations."""
+        standardize, encode, skipped = [], [], []
+        for col, typ, act in zip(actions["Variable"], actions["Type"], actions["Action"]):
+            if act == "Standardize":
+                if typ == "Numeric":
+                    standardize.append(col)
+                else:
+                    skipped.append((col, f"'{col}' is {typ}; standardize skipped."))
+            elif act == "Encode":
+                encode.append(col)
+            # 'None' → do nothing
+        pipeline = cls(standardize, encode)
+        pipeline.skipped = skipped
+        return pipeline
+
+    # ---- Fitting ----
+    def fit(self, df: pd.DataFrame) -> "PrepPipeline":
+        self._check_columns(df)
+
+        if self.standardize:
+            block = df[self.standardize].to_numpy(dtype=np.float64, na_value=np.nan)
+            counts = (~np.isnan(block)).sum(axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means = np.nansum(block, axis=0) / counts
+                # Sample std (ddof=1) to match pandas Series.std
+                stds = np.sqrt(np.nansum((block - means) ** 2, axis=0) / (counts - 1))
+            keep = []
+            for col, mean, sd in zip(self.standardize, means, stds):
+                if np.isfinite(sd) and sd != 0:
+                    self.means[col] = float(mean)
+                    self.stds[col] = float(sd)
+                    keep.append(col)
+                else:
+                    self.skipped.append((col, f"Skipped standardizing '{col}' (std is 0 or NaN)."))
+            self.standardize = keep
+
+        self.encoder = CategoryEncoder().fit(df, self.encode)
+
+        return self
+
+    # ---- Applying ----
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        self._check_columns(df)
+        # Shallow copy: untouched columns share buffers with the input
+        out = df.copy(deep=False)
+
+        if self.standardize:
+            cols = self.standardize
+            mean = np.array([self.means[c] for c in cols])
+            std = np.array([self.stds[c] for c in cols])
+            block = df[cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            out[cols] = ((block - mean) / std).astype(np.float32)
+
+        if self.encode:
+            out[self.encode] = self.encoder.transform(df)[self.encode]
+
+        return out
+
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self.fit(df).transform(df)
+
+    # ---- Persistence ----
+    def to_dict(self) -> dict:
+        return {
+            "standardize": self.standardize,
+            "encode": self.encode,
+            "means": self.means,
+            "stds": self.stds,
+            "categories": self.encoder.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "PrepPipeline":
+        pipeline = cls(state.get("standardize", ()), state.get("encode", ()))
+        pipeline.means = dict(state.get("means", {}))
+        pipeline.stds = dict(state.get("stds", {}))
+        pipeline.encoder = CategoryEncoder.from_dict(state.get("categories", {}))
+        return pipeline
+
+    def _check_columns(self, df: pd.DataFrame) -> None:
+        missing = [c for c in self.standardize + self.encode if c not in df.columns]
+        if missing:
+            raise KeyError(f"Columns not found in data: {missing}")
+
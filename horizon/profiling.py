@@ -0,0 +1,154 @@
+"""Per-rerun section timings (wall time, data shape, allocations) with JSONL/Prometheus export."""
+import json
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import wraps
+
+import pandas as pd
+
+PROFILE_DIR = os.path.join("data", ".profile")
+JSONL_PATH = os.path.join(PROFILE_DIR, "timings.jsonl")
+PROM_PATH = os.path.join(PROFILE_DIR, "horizon.prom")
+
+RECORD_COLUMNS = ["section", "depth", "seconds", "rows", "columns", "alloc_mb"]
+
+# tracemalloc is process-wide: it runs only while some profiler tracks memory,
+# and is stopped by the last one unless something else had started it
+_tracers = 0
+_started_tracing = False
+_tracers_lock = threading.Lock()
+
+
+def _acquire_tracing() -> None:
+    global _tracers, _started_tracing
+    with _tracers_lock:
+        if _tracers == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _tracers += 1
+
+
+def _release_tracing() -> None:
+    global _tracers, _started_tracing
+    with _tracers_lock:
+        _tracers -= 1
+        if _tracers == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+class Profiler:
+    """Collects one record per timed section of a script run.
+
+    Disabled profilers cost one branch per section. When enabled with
+    ``track_memory``, tracemalloc measures each section's peak allocation above
+    its starting point (this slows allocation-heavy code noticeably, for every
+    session, until :meth:`close`). Peaks of nested sections are carried up to
+    their parents; the peak counter itself is process-wide, so ``alloc_mb`` is
+    approximate while other sessions are profiling memory at the same time.
+    """
+
+    def __init__(self, enabled: bool = True, track_memory: bool = False):
+        self.enabled = enabled
+        self.track_memory = enabled and track_memory
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.records = []
+        self._depth = 0
+        self._peaks = []  # per open section: highest traced memory seen so far
+        self._release = None
+        if self.track_memory:
+            _acquire_tracing()
+            # Also released if a rerun is interrupted before close()
+            self._release = weakref.finalize(self, _release_tracing)
+
+    def close(self) -> None:
+        """Stop tracing allocations for this profiler (idempotent)."""
+        if self._release is not None:
+            self._release()
+
+    @contextmanager
+    def section(self, name: str, frame: pd.DataFrame = None):
+        """Time a block; set ``record["rows"]``/``["columns"]`` inside it if the shape is only known later."""
+        record = {"section": name, "depth": self._depth, "rows": None, "columns": None, "alloc_mb": None}
+        if frame is not None:
+            record["rows"], record["columns"] = frame.shape
+        if not self.enabled:
+            yield record
+            return
+
+        if self.track_memory:
+            base, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)  # keep the parent's peak before resetting
+            tracemalloc.reset_peak()
+            self._peaks.append(base)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            self._depth -= 1
+            if self.track_memory:
+                peak = max(tracemalloc.get_traced_memory()[1], self._peaks.pop())
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                record["alloc_mb"] = max(peak - base, 0) / 1e6
+            self.records.append(record)
+
+    def timed(self, name: str = None):
+        """Decorator form of :meth:`section`."""
+        def wrap(fn):
+            @wraps(fn)
+            def inner(*args, **kwargs):
+                with self.section(name or fn.__name__):
+                    return fn(*args, **kwargs)
+            return inner
+        return wrap
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.records, columns=RECORD_COLUMNS)
+
+    # ---- Export ----
+    def append_jsonl(self, path: str = JSONL_PATH, **context) -> None:
+        """One line per section, tagged with the run id and any ``context`` (e.g. the open view)."""
+        if not self.records:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for record in self.records:
+                f.write(json.dumps({"run_id": self.run_id, "ts": self.started, **context, **record}) + "\n")
+
+    def write_prometheus(self, path: str = PROM_PATH) -> None:
+        """Node-exporter textfile with the latest run's seconds per section (written atomically)."""
+        if not self.records:
+            return
+        totals = {}
+        for record in self.records:
+            totals[record["section"]] = totals.get(record["section"], 0.0) + record["seconds"]
+        lines = [
+            "# HELP horizon_section_seconds Wall time of a dashboard section in the latest rerun.",
+            "# TYPE horizon_section_seconds gauge",
+        ]
+        for section, seconds in totals.items():
+            label = section.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'horizon_section_seconds{{section="{label}"}} {seconds:.6f}')
+        directory, name = os.path.split(path)
+        os.makedirs(directory or ".", exist_ok=True)
+        # Per-writer temp name: concurrent sessions must not rename each other's file away
+        tmp = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
@@ -0,0 +1,74 @@
+"""Region rollups: per-Region summary statistics of axis scores and variables, precomputed once."""
+import numpy as np
+import pandas as pd
+
+from .scoring import AXES
+
+GROUP_COLUMN = "Region"
+STATS = ["mean", "median", "min", "max", "count"]
+
+
+def region_labels(df: pd.DataFrame, group: str = GROUP_COLUMN) -> pd.Series:
+    """Group label per row ("All" when the data has no ``group`` column)."""
+    if group in df.columns:
+        return df[group].astype(str).rename(group)
+    return pd.Series("All", index=df.index, name=group)
+
+
+def variable_rollup(df: pd.DataFrame, columns: list, regions: pd.Series) -> pd.DataFrame:
+    """Region × (Variable, Stat) statistics of the numeric ``columns``."""
+    numeric = [c for c in columns if pd.api.types.is_numeric_dtype(df[c].dtype)]
+    if not numeric:
+        columns = pd.MultiIndex.from_arrays([[], []], names=["Variable", "Stat"])
+        return pd.DataFrame(index=pd.Index([], name=regions.name), columns=columns)
+    return df[numeric].groupby(regions.to_numpy(), sort=True).agg(STATS).rename_axis(regions.name)
+
+
+def score_rollup(values: np.ndarray, years: list, regions: pd.Series) -> pd.DataFrame:
+    """(Region, Year) × (Axis, Stat) statistics of one model's ``(entities, years, axes)`` scores."""
+    flat = pd.DataFrame(
+        values.reshape(len(values), -1),
+        columns=pd.MultiIndex.from_product([years, AXES], names=["Year", "Axis"]),
+    )
+    stats = flat.groupby(regions.to_numpy(), sort=True).agg(STATS).rename_axis(regions.name)
+    return stats.stack(level="Year").sort_index()
+
+
+class RegionCube:
+    """Lookup of Region-level aggregates, assembled from independently cached parts.
+
+    ``variables`` is Region × (Variable, Stat); ``scores`` maps each model to a
+    (Region, Year) × (Axis, Stat) frame. Parts are built per column block and per
+    model, so a changed overlay column or an edited model only rebuilds its part.
+    """
+
+    def __init__(self, variables: pd.DataFrame, scores: dict):
+        self.variables = variables
+        self.scores = scores
+
+    @classmethod
+    def combine(cls, base: pd.DataFrame, overlay: pd.DataFrame, scores: dict) -> "RegionCube":
+        """Base variable stats with any overlay (transformed) columns replacing theirs."""
+        if overlay is not None and not overlay.empty:
+            replaced = overlay.columns.get_level_values(0).unique()
+            base = base.drop(columns=replaced, level=0, errors="ignore").join(overlay)
+        return cls(base, scores)
+
+    @property
+    def regions(self) -> list:
+        return self.variables.index.tolist()
+
+    def counts(self) -> pd.Series:
+        """Entities per Region (from any model's score counts, else the first variable's)."""
+        for stats in self.scores.values():
+            return stats.xs(AXES[0], axis=1, level="Axis")["count"].groupby(level=0).max()
+        return self.variables.iloc[:, self.variables.columns.get_level_values(1) == "count"].max(axis=1)
+
+    def score_stats(self, model: str, year, stat: str = "mean") -> pd.DataFrame:
+        """Region × Axis table of one statistic for one model-year."""
+        by_year = self.scores[model].xs(int(year), level="Year")
+        return by_year.xs(stat, axis=1, level=1)
+
+    def variable_stats(self, variable: str) -> pd.DataFrame:
+        """Region × Stat table for one variable."""
+        return self.variables[variable]
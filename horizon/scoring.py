@@ -0,0 +1,112 @@
+"""Axis scoring: model weights applied to the dataset as one matrix product."""
+import os
+
+import numpy as np
+import pandas as pd
+
+AXES = ["X", "Y", "Z"]
+WEIGHT_COLUMNS = ["Model", "Axis", "Variable", "Weight"]
+
+
+def read_weights(path: str) -> pd.DataFrame:
+    """Read a Model/Axis/Variable/Weight CSV (tolerates a BOM and padded names)."""
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=WEIGHT_COLUMNS)
+    weights = pd.read_csv(path, encoding="utf-8-sig")
+    return normalise_weights(weights)
+
+
+def normalise_weights(weights: pd.DataFrame) -> pd.DataFrame:
+    weights = weights[WEIGHT_COLUMNS].copy()
+    for col in ["Model", "Axis", "Variable"]:
+        weights[col] = weights[col].astype(str).str.strip()
+    weights["Axis"] = weights["Axis"].str.upper()
+    weights["Weight"] = pd.to_numeric(weights["Weight"], errors="coerce").fillna(0)
+    return weights
+
+
+def axis_variables(df: pd.DataFrame) -> list:
+    """Numeric ``X_*``/``Y_*``/``Z_*`` columns available for scoring."""
+    return [
+        c for c in df.columns
+        if str(c)[:2] in ("X_", "Y_", "Z_") and pd.api.types.is_numeric_dtype(df[c].dtype)
+    ]
+
+
+class WeightMatrix:
+    """Dense ``(models, axes, variables)`` weights aligned to a dataset's columns."""
+
+    def __init__(self, models: list, variables: list, values: np.ndarray):
+        self.models = models
+        self.variables = variables
+        self.values = values
+
+    @classmethod
+    def from_frame(cls, weights: pd.DataFrame, variables: list) -> "WeightMatrix":
+        models = pd.unique(weights["Model"]).tolist()
+        model_idx = pd.Index(models).get_indexer(weights["Model"])
+        axis_idx = pd.Index(AXES).get_indexer(weights["Axis"])
+        var_idx = pd.Index(variables).get_indexer(weights["Variable"])
+
+        ok = (axis_idx >= 0) & (var_idx >= 0)
+        values = np.zeros((len(models), len(AXES), len(variables)))
+        # Duplicate rows accumulate, matching a sum over the weights table
+        np.add.at(values, (model_idx[ok], axis_idx[ok], var_idx[ok]), weights["Weight"].to_numpy(float)[ok])
+        return cls(models, list(variables), values)
+
+    def matched(self, model: str) -> bool:
+        """True when at least one of the model's weights hits a dataset column."""
+        return bool(np.any(self.values[self.models.index(model)]))
+
+
+def score_matrix(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """``(entities, variables) x (models, axes, variables) → (entities, models, axes)``.
+
+    Missing values contribute nothing to an axis score.
+    """
+    n_models, n_axes, n_vars = weights.shape
+    flat = np.nan_to_num(values, nan=0.0) @ weights.reshape(n_models * n_axes, n_vars).T
+    return flat.reshape(len(values), n_models, n_axes)
+
+
+class LiveScorer:
+    """One model's axis scores, updated by a single column delta when one weight changes.
+
+    ``values`` holds the per-variable contribution columns (entities × variables);
+    moving weight ``w[a, v]`` by ``d`` shifts axis ``a`` by ``d * values[:, v]``, so a
+    slider change costs O(entities) instead of a full rescore.
+    """
+
+    def __init__(self, values: np.ndarray, variables: list, index: pd.Index = None):
+        self.values = np.nan_to_num(np.asarray(values, dtype=np.float64), nan=0.0)
+        self.variables = list(variables)
+        self.index = index if index is not None else pd.RangeIndex(len(self.values))
+        self.weights = np.zeros((len(AXES), len(self.variables)))
+        self.scores = np.zeros((len(self.values), len(AXES)))
+        self._position = {v: j for j, v in enumerate(self.variables)}
+
+    def set_weight(self, axis: str, variable: str, weight: float) -> bool:
+        """Apply one weight; returns False when nothing changed or the variable is unknown."""
+        j = self._position.get(variable)
+        if j is None:
+            return False
+        a = AXES.index(axis)
+        delta = float(weight) - self.weights[a, j]
+        if delta == 0:
+            return False
+        self.scores[:, a] += delta * self.values[:, j]
+        self.weights[a, j] = weight
+        return True
+
+    def set_weights(self, weights: pd.DataFrame) -> int:
+        """Apply Axis/Variable/Weight rows; only changed weights cost anything."""
+        return sum(
+            self.set_weight(a, v, w) for a, v, w in zip(weights["Axis"], weights["Variable"], weights["Weight"])
+        )
+
+    def refresh(self) -> None:
+        """Recompute from scratch (drops any accumulated floating-point drift)."""
+        self.scores = self.values @ self.weights.T
+
+    def frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.scores.copy(), index=self.index, columns=AXES)
@@ -0,0 +1,157 @@
+"""Monte Carlo weight sensitivity: how stable are ranks and quadrants under perturbed weights."""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .scoring import AXES
+
+# Working memory per scoring chunk; override with HORIZON_SENSITIVITY_BUDGET_MB
+MEMORY_BUDGET_MB = float(os.environ.get("HORIZON_SENSITIVITY_BUDGET_MB", 64))
+# Worker processes for the chunks (0 scores in-process); override with HORIZON_SENSITIVITY_WORKERS
+WORKERS = int(os.environ.get("HORIZON_SENSITIVITY_WORKERS", 0))
+
+# Quadrant code = (X >= 0) + 2 * (Y >= 0)
+QUADRANTS = ["X− Y−", "X+ Y−", "X− Y+", "X+ Y+"]
+RANK_AXES = AXES[:2]
+
+
+def quadrant_codes(scores: np.ndarray) -> np.ndarray:
+    """``(..., axes)`` scores → quadrant code per point (see :data:`QUADRANTS`)."""
+    return (scores[..., 0] >= 0).astype(np.int8) + 2 * (scores[..., 1] >= 0).astype(np.int8)
+
+
+def chunk_samples(entities: int, variables: int, budget_mb: float = MEMORY_BUDGET_MB) -> int:
+    """Weight samples per chunk so one chunk's scores, weights and rank buffers fit ``budget_mb``."""
+    per_sample = 8 * (len(AXES) * (entities + variables) + 2 * len(RANK_AXES) * entities)
+    return max(1, int(budget_mb * 1e6 // per_sample))
+
+
+def rank_bins(entities: int, budget_mb: float = MEMORY_BUDGET_MB) -> int:
+    """Rank-histogram bins per entity and axis that fit ``budget_mb`` (one bin per rank when possible).
+
+    Per bin: a uint32 count per entity and axis, plus the int64 per-axis
+    ``bincount`` buffer that is added into it.
+    """
+    per_bin = entities * (4 * len(RANK_AXES) + 8)
+    return int(min(max(entities, 1), max(1, budget_mb * 1e6 // max(per_bin, 1))))
+
+
+def _rank_dtype(entities: int):
+    return np.uint16 if entities < np.iinfo(np.uint16).max else np.uint32
+
+
+def _score_chunk(values: np.ndarray, weights: np.ndarray, start: int, count: int, sigma: float, seed: int) -> tuple:
+    """Score ``count`` perturbed weight sets in one matrix product.
+
+    Returns per-entity quadrant counts ``(4, entities)`` and X/Y ranks
+    ``(count, entities, 2)`` (1 = highest score).
+    """
+    # Seeded by chunk start, so results do not depend on which worker ran the chunk
+    rng = np.random.default_rng([seed, start])
+    n_axes, n_vars = weights.shape
+    # Multiplicative log-normal noise keeps each weight's sign and leaves zero weights at zero
+    samples = weights * rng.lognormal(0.0, sigma, size=(count, n_axes, n_vars))
+    scores = (values @ samples.reshape(count * n_axes, n_vars).T).reshape(len(values), count, n_axes)
+    scores = scores.transpose(1, 0, 2)  # (samples, entities, axes)
+
+    codes = quadrant_codes(scores)
+    quadrant_counts = np.stack([(codes == q).sum(axis=0) for q in range(len(QUADRANTS))])
+    del codes
+
+    order = np.argsort(-scores[..., :len(RANK_AXES)], axis=1, kind="stable")
+    ranks = np.empty(order.shape, dtype=_rank_dtype(len(values)))
+    positions = np.arange(1, len(values) + 1, dtype=ranks.dtype)[None, :, None]
+    np.put_along_axis(ranks, order, np.broadcast_to(positions, order.shape), axis=1)
+    return quadrant_counts, ranks
+
+
+def _chunk_results(values, weights, chunks, sigma, seed, workers):
+    """Chunk results in order; with workers, at most ``2 × workers`` chunks are pending at once."""
+    if not workers or len(chunks) <= 1:
+        for start, count in chunks:
+            yield _score_chunk(values, weights, start, count, sigma, seed)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start, count in chunks:
+            pending.append(pool.submit(_score_chunk, values, weights, start, count, sigma, seed))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _histogram_quantiles(hist: np.ndarray, samples: int, qs: list, width: int, entities: int) -> list:
+    """Ranks at quantiles ``qs`` (``"nearest"`` method) from per-entity rank histograms ``(entities, bins)``.
+
+    With one rank per bin this equals ``np.quantile`` over all samples; wider
+    bins return the bin's middle rank (within ``width // 2`` of the exact value).
+    """
+    cumulative = np.cumsum(hist, axis=1)
+    out = []
+    for q in qs:
+        position = int(np.around(q * (samples - 1)))  # 0-based index into the sorted samples
+        bins = (cumulative <= position).sum(axis=1)
+        out.append(np.minimum(bins * width + 1 + (width - 1) // 2, entities))
+    return out
+
+
+def weight_sensitivity(values: np.ndarray, weights: np.ndarray, samples: int = 1000, sigma: float = 0.25,
+                       seed: int = 0, interval: float = 0.9, memory_budget_mb: float = MEMORY_BUDGET_MB,
+                       workers: int = WORKERS) -> pd.DataFrame:
+    """Rank intervals and quadrant-flip probabilities under ``samples`` perturbed weight sets.
+
+    ``values`` is entities × variables (no NaN), ``weights`` is axes × variables.
+    Each sample multiplies every weight by log-normal noise with log-scale
+    ``sigma``. Samples are scored in chunks of one matrix product each, sized to
+    ``memory_budget_mb``; with ``workers > 0`` chunks run in a process pool.
+    Each chunk's ranks go into a per-entity rank histogram (also sized to
+    ``memory_budget_mb``) and are then dropped, so memory does not grow with
+    ``samples``. Rank quantiles are exact while the histogram has one bin per
+    rank, otherwise within half a bin. Results are reproducible for a given
+    seed and budget.
+
+    Returns one row per entity (in ``values`` order) with the X/Y rank median and
+    central ``interval``, the base quadrant, the probability of landing in a
+    different one, and the most likely alternative quadrant.
+    """
+    if samples < 1:
+        raise ValueError("samples must be at least 1.")
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    n = len(values)
+    step = chunk_samples(n, weights.shape[1], memory_budget_mb)
+    chunks = [(start, min(step, samples - start)) for start in range(0, samples, step)]
+
+    bins = rank_bins(n, memory_budget_mb)
+    width = -(-n // bins)  # ranks per bin
+    offsets = (np.arange(n, dtype=np.int64) * bins)[None, :]
+    quadrant_counts = np.zeros((len(QUADRANTS), n), dtype=np.int64)
+    hist = np.zeros((len(RANK_AXES), n, bins), dtype=np.uint32)
+    for counts, ranks in _chunk_results(values, weights, chunks, sigma, seed, workers):
+        quadrant_counts += counts
+        for a in range(len(RANK_AXES)):
+            flat = offsets + (ranks[..., a].astype(np.int64) - 1) // width  # (samples, entities) → entity × bin
+            hist[a] += np.bincount(flat.ravel(), minlength=n * bins).reshape(n, bins).astype(np.uint32)
+        del ranks
+
+    base = quadrant_codes(values @ weights.T)
+    stay = quadrant_counts[base, np.arange(n)]
+    others = quadrant_counts.copy()
+    others[base, np.arange(n)] = -1
+    alternative = others.argmax(axis=0)
+
+    tail = (1 - interval) / 2
+    out = {}
+    for a, axis in enumerate(RANK_AXES):
+        low, median, high = _histogram_quantiles(hist[a], samples, [tail, 0.5, 1 - tail], width, n)
+        out[f"{axis} rank"] = median
+        out[f"{axis} rank low"] = low
+        out[f"{axis} rank high"] = high
+    out["Quadrant"] = np.asarray(QUADRANTS)[base]
+    out["Flip probability"] = 1 - stay / samples
+    out["Likely flip to"] = np.where(stay < samples, np.asarray(QUADRANTS)[alternative], "")
+    return pd.DataFrame(out)
@@ -0,0 +1,65 @@
+"""Per-session views over one shared, read-only base dataset."""
+import weakref
+
+import pandas as pd
+
+from .data import derive_fingerprint
+
+# Shallow copies must never write through to the shared base (default from pandas 3.0)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+_views = weakref.WeakSet()
+
+
+class DatasetView:
+    """A session's processed data: the process-wide base frame plus only the columns it replaced.
+
+    The base is never copied or mutated; ``apply`` stores transformed columns in
+    the overlay and ``reset`` simply drops it. ``frame()`` composes base + overlay
+    as a shallow frame whose untouched columns share the base's buffers.
+    """
+
+    def __init__(self, base: pd.DataFrame, fingerprint: str):
+        self.base = base
+        self.base_fp = fingerprint
+        self.fingerprint = fingerprint
+        self.overlay = {}
+        self._frame = None
+        _views.add(self)
+
+    def frame(self) -> pd.DataFrame:
+        if not self.overlay:
+            return self.base
+        if self._frame is None:
+            frame = self.base.copy(deep=False)
+            for col, values in self.overlay.items():
+                frame[col] = values
+            self._frame = frame
+        return self._frame
+
+    def apply(self, transformed: pd.DataFrame, columns: list, step) -> None:
+        """Keep ``columns`` of ``transformed`` as this session's overlay; ``step`` describes the change."""
+        for col in columns:
+            self.overlay[col] = transformed[col]
+        self._frame = None
+        self.fingerprint = derive_fingerprint(self.fingerprint, step)
+
+    def reset(self) -> None:
+        self.overlay.clear()
+        self._frame = None
+        self.fingerprint = self.base_fp
+
+    def overlay_bytes(self) -> int:
+        return int(sum(s.memory_usage(index=False, deep=True) for s in self.overlay.values()))
+
+    def memory_report(self) -> dict:
+        """This session's own footprint next to the shared base, plus process-wide totals."""
+        views = list(_views)
+        return {
+            "base_mb": self.base.memory_usage(index=True, deep=True).sum() / 1e6,
+            "overlay_columns": len(self.overlay),
+            "overlay_mb": self.overlay_bytes() / 1e6,
+            "sessions": len(views),
+            "all_overlays_mb": sum(v.overlay_bytes() for v in views) / 1e6,
+        }
@@ -0,0 +1,264 @@
+"""Content-addressed snapshots of processed data: column chunks stored once, loaded lazily.
+
+Each column is cut into ``CHUNK_ROWS``-row chunks; a chunk is stored as a
+one-column Parquet object named by the hash of its dtype and values, so a column
+unchanged since an earlier snapshot (or shared with another session's) costs
+nothing to save again. A snapshot is a small JSON manifest listing its columns'
+chunk hashes plus metadata (Action table, fitted pipeline, weights), and is
+itself named by the hash of that content.
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from .export import write_atomic, write_json_atomic
+from .jobs import report_progress
+
+SNAPSHOT_DIR = os.path.join("data", "snapshots")
+# Rows per stored chunk; a chunk whose content already exists is not written again
+CHUNK_ROWS = 65_536
+
+# One lock per store directory, shared by every SnapshotStore on it in this process
+_locks = {}
+_locks_guard = threading.Lock()
+
+LISTING_COLUMNS = ["ID", "Name", "Created", "Rows", "Columns", "New MB"]
+DIFF_COLUMNS = ["Column", "Status"]
+
+
+def chunk_hash(values: pd.Series) -> str:
+    """Content hash of a column chunk: dtype (with categories) and values; the column name is ignored."""
+    h = hashlib.sha1(repr(values.dtype).encode())
+    h.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def column_hashes(values: pd.Series, chunk_rows: int = CHUNK_ROWS) -> list:
+    return [chunk_hash(values.iloc[i:i + chunk_rows]) for i in range(0, max(len(values), 1), chunk_rows)]
+
+
+def _changed_rows(current: pd.Series, stored: pd.Series):
+    """Rows whose value differs (missing == missing), or ``None`` when the lengths differ."""
+    if len(current) != len(stored):
+        return None
+    a, b = current.to_numpy(dtype=object), stored.to_numpy(dtype=object)
+    same = (a == b) | (pd.isna(a) & pd.isna(b))
+    return int((~same).sum())
+
+
+def _mean(values: pd.Series) -> float:
+    if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+        return float(values.mean())
+    return np.nan
+
+
+class Snapshot:
+    """One saved snapshot; columns are read from the store only when asked for."""
+
+    def __init__(self, store: "SnapshotStore", manifest: dict):
+        self.store = store
+        self.manifest = manifest
+        self.id = manifest["id"]
+        self.name = manifest["name"]
+        self.created = manifest["created"]
+        self.rows = manifest["rows"]
+        self.metadata = manifest.get("metadata", {})
+        self.chunk_rows = manifest.get("chunk_rows", store.chunk_rows)
+        self._chunks = {c["name"]: c["chunks"] for c in manifest["columns"]}
+
+    @property
+    def columns(self) -> list:
+        return list(self._chunks)
+
+    def column(self, name: str) -> pd.Series:
+        parts = [self.store.read_chunk(digest) for digest in self._chunks[name]]
+        values = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+        return values.rename(name)
+
+    def frame(self, columns: list = None) -> pd.DataFrame:
+        """The snapshot's data, limited to ``columns`` (only their chunks are read)."""
+        columns = self.columns if columns is None else list(columns)
+        missing = [c for c in columns if c not in self._chunks]
+        if missing:
+            raise KeyError(f"Columns not in snapshot {self.id}: {missing}")
+        return pd.DataFrame({c: self.column(c) for c in columns}, columns=columns)
+
+    def actions(self) -> pd.DataFrame:
+        return pd.DataFrame(self.metadata.get("actions") or [])
+
+    def weights(self) -> pd.DataFrame:
+        return pd.DataFrame((self.metadata.get("weights") or {}).get("table") or [])
+
+    def diff(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Per column: identical / changed / only in snapshot / only in current, from chunk hashes alone."""
+        rows = []
+        for col in self.columns:
+            if col not in df.columns:
+                rows.append((col, "only in snapshot"))
+            else:
+                same = column_hashes(df[col], self.chunk_rows) == self._chunks[col]
+                rows.append((col, "identical" if same else "changed"))
+        rows += [(col, "only in current") for col in df.columns if col not in self._chunks]
+        return pd.DataFrame(rows, columns=DIFF_COLUMNS)
+
+    def compare(self, df: pd.DataFrame, columns: list, stored: pd.DataFrame = None) -> pd.DataFrame:
+        """Side-by-side summary of ``columns`` in the snapshot and in ``df``.
+
+        ``stored`` is this snapshot's ``frame`` of those columns if the caller
+        already read it; otherwise only those columns are read here.
+        """
+        if stored is None:
+            stored = self.frame([c for c in columns if c in self._chunks])
+        rows = []
+        for col in columns:
+            old = stored[col] if col in stored.columns else None
+            current = df[col] if col in df.columns else None
+            rows.append({
+                "Column": col,
+                "Snapshot dtype": str(old.dtype) if old is not None else None,
+                "Current dtype": str(current.dtype) if current is not None else None,
+                "Changed rows": _changed_rows(current, old) if old is not None and current is not None else None,
+                "Snapshot mean": _mean(old) if old is not None else np.nan,
+                "Current mean": _mean(current) if current is not None else np.nan,
+            })
+        return pd.DataFrame(rows)
+
+
+def _store_lock(root: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(os.path.abspath(root), threading.Lock())
+
+
+class SnapshotStore:
+    """Chunk objects plus manifests under ``root``.
+
+    A save relies on chunks it found already stored until its manifest is
+    written, so saves and deletes (which drop unreferenced chunks) take the
+    store's lock and never interleave.
+    """
+
+    def __init__(self, root: str = SNAPSHOT_DIR, chunk_rows: int = CHUNK_ROWS):
+        self.root = root
+        self.chunk_rows = chunk_rows
+        self._lock = _store_lock(root)
+        self.objects_dir = os.path.join(root, "objects")
+        self.manifests_dir = os.path.join(root, "manifests")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.parquet")
+
+    def _manifest_path(self, snapshot_id: str) -> str:
+        return os.path.join(self.manifests_dir, f"{snapshot_id}.json")
+
+    def read_chunk(self, digest: str) -> pd.Series:
+        return pq.read_table(self._object_path(digest)).to_pandas()["v"]
+
+    def _put_chunk(self, values: pd.Series) -> tuple:
+        """``(digest, bytes written)``; 0 bytes when the chunk is already stored."""
+        digest = chunk_hash(values)
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return digest, 0
+        return digest, write_atomic(values.reset_index(drop=True).to_frame("v"), path, "Parquet (zstd)")
+
+    def save(self, df: pd.DataFrame, name: str, metadata: dict = None) -> Snapshot:
+        """Store ``df`` (index not kept), writing only chunks not already in the store.
+
+        Saving the same data with the same metadata again returns the existing snapshot.
+        """
+        with self._lock:
+            return self._save(df, name, metadata)
+
+    def _save(self, df: pd.DataFrame, name: str, metadata: dict) -> Snapshot:
+        columns, written, reused = [], 0, 0
+        for k, col in enumerate(df.columns):
+            chunks = []
+            for i in range(0, max(len(df), 1), self.chunk_rows):
+                digest, size = self._put_chunk(df[col].iloc[i:i + self.chunk_rows])
+                chunks.append(digest)
+                written += size
+                reused += size == 0
+            columns.append({"name": str(col), "dtype": str(df[col].dtype), "chunks": chunks})
+            report_progress((k + 1) / max(len(df.columns), 1))
+
+        metadata = metadata or {}
+        content = json.dumps({"rows": len(df), "columns": columns, "metadata": metadata}, sort_keys=True, default=str)
+        snapshot_id = hashlib.sha1(content.encode()).hexdigest()[:16]
+        path = self._manifest_path(snapshot_id)
+        if os.path.exists(path):
+            return self.open(snapshot_id)
+        manifest = {
+            "id": snapshot_id,
+            "name": name,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "rows": len(df),
+            "chunk_rows": self.chunk_rows,
+            "columns": columns,
+            "metadata": metadata,
+            "new_bytes": written,
+            "reused_chunks": int(reused),
+        }
+        os.makedirs(self.manifests_dir, exist_ok=True)
+        write_json_atomic(json.loads(json.dumps(manifest, default=str)), path)
+        return Snapshot(self, manifest)
+
+    def open(self, snapshot_id: str) -> Snapshot:
+        path = self._manifest_path(snapshot_id)
+        if not os.path.exists(path):
+            raise KeyError(snapshot_id)
+        with open(path, encoding="utf-8") as f:
+            return Snapshot(self, json.load(f))
+
+    def _manifests(self) -> list:
+        if not os.path.isdir(self.manifests_dir):
+            return []
+        out = []
+        for name in os.listdir(self.manifests_dir):
+            if name.endswith(".json"):
+                with open(os.path.join(self.manifests_dir, name), encoding="utf-8") as f:
+                    out.append(json.load(f))
+        return out
+
+    def list(self) -> pd.DataFrame:
+        """Saved snapshots, newest first."""
+        rows = [
+            (m["id"], m["name"], m["created"], m["rows"], len(m["columns"]), m.get("new_bytes", 0) / 1e6)
+            for m in self._manifests()
+        ]
+        listing = pd.DataFrame(rows, columns=LISTING_COLUMNS)
+        return listing.sort_values(["Created", "ID"], ascending=False, ignore_index=True)
+
+    def revision(self) -> int:
+        """Changes whenever a snapshot is saved or deleted (manifest names and directory mtime, no reads)."""
+        try:
+            return hash((os.stat(self.manifests_dir).st_mtime_ns, frozenset(os.listdir(self.manifests_dir))))
+        except FileNotFoundError:
+            return 0
+
+    def disk_bytes(self) -> int:
+        total = 0
+        for directory, _, files in os.walk(self.objects_dir):
+            total += sum(os.path.getsize(os.path.join(directory, f)) for f in files)
+        return total
+
+    def delete(self, snapshot_id: str) -> int:
+        """Remove a snapshot and every chunk no other snapshot references; returns the chunks removed."""
+        path = self._manifest_path(snapshot_id)
+        with self._lock:
+            if not os.path.exists(path):
+                raise KeyError(snapshot_id)
+            os.remove(path)
+            referenced = {d for m in self._manifests() for c in m["columns"] for d in c["chunks"]}
+            removed = 0
+            for directory, _, files in os.walk(self.objects_dir):
+                for f in files:
+                    if f.endswith(".parquet") and f[:-len(".parquet")] not in referenced:
+                        os.remove(os.path.join(directory, f))
+                        removed += 1
+        return removed
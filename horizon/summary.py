@@ -0,0 +1,115 @@
+"""Variable summary for the Data Preparation tab, computed column-block-wise."""
+import numpy as np
+import pandas as pd
+
+SUMMARY_COLUMNS = ["Variable", "Type", "Min", "Max", "Mean", "Std", "Missing", "Unique", "Action"]
+
+_IDENTIFIER_HINTS = ["id", "uuid", "guid", "email", "phone", "mobile", "account", "postcode", "zip", "ssn"]
+
+
+# ---- Default action guessers ----
+def likely_identifier(col_name: str) -> bool:
+    col = str(col_name).lower()
+    return any(k in col for k in _IDENTIFIER_HINTS)
+
+
+def guess_action(col_name: str, numeric: bool, n: int, count: int, nunique: int) -> str:
+    """Suggest an Action from precomputed column stats (no rescan of the data)."""
+    # Nothing there → do nothing
+    if count == 0:
+        return "None"
+
+    # Obvious IDs/keys → do nothing
+    if likely_identifier(col_name):
+        return "None"
+
+    if numeric:
+        # Constant numeric → do nothing
+        if nunique <= 1:
+            return "None"
+        # Low-cardinality numeric (binary/few levels) → Encode
+        if nunique <= 2 or nunique <= max(10, int(0.03 * n)):
+            return "Encode"
+        # Otherwise treat as continuous → Standardize
+        return "Standardize"
+    else:
+        # Extremely high-cardinality text → do nothing
+        if nunique > max(100, int(0.5 * n)):
+            return "None"
+        return "Encode"
+
+
+# ---- Block statistics ----
+def numeric_stats(values: np.ndarray) -> dict:
+    """Per-column count/min/max/mean/std/nunique for an (n_rows, n_cols) float array.
+
+    NaNs are ignored; all-NaN columns yield NaN stats and zero counts.
+    Std is the population std (ddof=0), matching ``np.nanstd``.
+    """
+    n_cols = values.shape[1]
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=0)
+    has = count > 0
+
+    vmin = np.where(valid, values, np.inf).min(axis=0, initial=np.inf)
+    vmax = np.where(valid, values, -np.inf).max(axis=0, initial=-np.inf)
+    # ±inf values give a ±inf or NaN mean and a NaN std; inf - inf is expected there, not warned about
+    with np.errstate(invalid="ignore"):
+        total = np.where(valid, values, 0.0).sum(axis=0)
+        mean = np.divide(total, count, out=np.full(n_cols, np.nan), where=has)
+        sq = np.where(valid, values - mean, 0.0)
+        var = np.divide((sq * sq).sum(axis=0), count, out=np.full(n_cols, np.nan), where=has)
+
+    # Cardinality: sort each column once (NaNs go last) and count value changes
+    ordered = np.sort(values, axis=0)
+    ordered_valid = ~np.isnan(ordered)
+    changes = (ordered[1:] != ordered[:-1]) & ordered_valid[1:]  # not np.diff: inf - inf is NaN
+    nunique = changes.sum(axis=0) + has
+
+    return {
+        "count": count,
+        "min": np.where(has, vmin, np.nan),
+        "max": np.where(has, vmax, np.nan),
+        "mean": mean,
+        "std": np.sqrt(var),
+        "nunique": nunique,
+    }
+
+
+def variable_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """One row per column with stats, missing/unique counts and a suggested Action."""
+    if df.columns.empty:
+        return pd.DataFrame(columns=SUMMARY_COLUMNS)
+
+    n = len(df)
+    is_numeric = np.array([pd.api.types.is_numeric_dtype(t) for t in df.dtypes])
+    numeric_cols = df.columns[is_numeric]
+    other_cols = df.columns[~is_numeric]
+
+    out = pd.DataFrame(index=df.columns)
+    out["Type"] = np.where(is_numeric, "Numeric", "Categorical")
+    for name in ["Min", "Max", "Mean", "Std"]:
+        out[name] = np.nan
+    out["Missing"] = 0
+    out["Unique"] = 0
+
+    if len(numeric_cols):
+        stats = numeric_stats(df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan))
+        out.loc[numeric_cols, "Min"] = stats["min"]
+        out.loc[numeric_cols, "Max"] = stats["max"]
+        out.loc[numeric_cols, "Mean"] = stats["mean"]
+        out.loc[numeric_cols, "Std"] = stats["std"]
+        out.loc[numeric_cols, "Missing"] = n - stats["count"]
+        out.loc[numeric_cols, "Unique"] = stats["nunique"]
+
+    if len(other_cols):
+        block = df[other_cols]
+        out.loc[other_cols, "Missing"] = block.isna().sum().to_numpy()
+        out.loc[other_cols, "Unique"] = block.nunique(dropna=True).to_numpy()
+
+    out["Action"] = [
+        guess_action(col, numeric, n, n - int(missing), int(unique))
+        for col, numeric, missing, unique in zip(out.index, is_numeric, out["Missing"], out["Unique"])
+    ]
+    out = out.rename_axis("Variable").reset_index()
+    return out[SUMMARY_COLUMNS]
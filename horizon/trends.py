@@ -0,0 +1,112 @@
+"""Trend engine: least-squares slope, acceleration and projections for year-suffixed series."""
+import numpy as np
+import pandas as pd
+
+from .years import split_year
+
+# Years projected past the last observed year
+PROJECTION_YEARS = 3
+# Fewer distinct years than this and a series has no acceleration to fit
+MIN_YEARS = 3
+
+
+def _solve(values: np.ndarray, t: np.ndarray, degree: int) -> tuple:
+    """Polynomial least-squares coefficients (increasing powers of ``t``) for every row.
+
+    Rows are grouped by missing-value pattern and each group is one product with
+    the pseudo-inverse of its design matrix, so the cost is one small solve per
+    pattern rather than per entity. Rows with too few points get NaN.
+    """
+    coefficients = np.full((len(values), degree + 1), np.nan)
+    observed = ~np.isnan(values)
+    # One integer per row's missing-value pattern (bit j set = year j observed)
+    keys = observed @ (1 << np.arange(values.shape[1], dtype=np.int64))
+    for key in np.unique(keys):
+        rows = keys == key
+        pattern = observed[np.argmax(rows)]
+        if pattern.sum() <= degree:
+            continue
+        design = np.vander(t[pattern], degree + 1, increasing=True)
+        coefficients[rows] = values[np.ix_(rows, pattern)] @ np.linalg.pinv(design).T
+    return coefficients, observed.sum(axis=1)
+
+
+class TrendFit:
+    """Linear and quadratic fits of one series (e.g. ``Y_Government_debt``) for all entities.
+
+    Time is centred on the mean observed year. ``slope`` is the linear fit's
+    change per year, ``acceleration`` the quadratic fit's second derivative
+    (change in slope per year); projections extend the linear fit.
+    """
+
+    def __init__(self, series: str, years: list, values: np.ndarray, index: pd.Index):
+        self.series = series
+        self.years = [int(y) for y in years]
+        self.index = index
+        self.values = values  # (entities, years) observed
+        self.t0 = float(np.mean(self.years))
+        t = np.asarray(self.years, dtype=np.float64) - self.t0
+        self.linear, self.n_obs = _solve(values, t, 1)
+        self.quadratic, _ = _solve(values, t, 2)
+
+    @property
+    def slope(self) -> np.ndarray:
+        return self.linear[:, 1]
+
+    @property
+    def acceleration(self) -> np.ndarray:
+        return 2 * self.quadratic[:, 2]
+
+    def projection_years(self, horizon: int = PROJECTION_YEARS) -> list:
+        return list(range(self.years[-1] + 1, self.years[-1] + 1 + horizon))
+
+    def predict(self, years: list) -> np.ndarray:
+        """Linear-fit values for ``years`` (entities × years)."""
+        t = np.asarray(years, dtype=np.float64) - self.t0
+        return self.linear[:, :1] + self.linear[:, 1:] * t
+
+    def summary(self) -> pd.DataFrame:
+        """Per-entity slope, acceleration, observed-year count and next-year projection."""
+        return pd.DataFrame({
+            "Slope": self.slope,
+            "Acceleration": self.acceleration,
+            "Years": self.n_obs,
+            f"Projected {self.years[-1] + 1}": self.predict([self.years[-1] + 1])[:, 0],
+        }, index=self.index)
+
+    def history(self, entity, horizon: int = PROJECTION_YEARS) -> pd.DataFrame:
+        """Observed, fitted and projected values of one entity (long format for a line chart)."""
+        row = self.index.get_loc(entity)
+        ahead = self.projection_years(horizon)
+        fitted = self.predict(self.years + ahead)[row]
+        n = len(self.years)
+        return pd.DataFrame({
+            "Year": self.years * 2 + ahead,
+            "Value": np.concatenate([self.values[row], fitted]),
+            "Kind": ["Observed"] * n + ["Fitted"] * n + ["Projected"] * len(ahead),
+        }).dropna(subset=["Value"])
+
+    def derived_columns(self) -> pd.DataFrame:
+        """``<series>_slope`` and ``<series>_accel`` columns (same axis prefix, so they score like any variable)."""
+        return pd.DataFrame({
+            f"{self.series}_slope": self.slope.astype(np.float32),
+            f"{self.series}_accel": self.acceleration.astype(np.float32),
+        }, index=self.index)
+
+
+def fit_trends(df: pd.DataFrame, columns: list, min_years: int = MIN_YEARS) -> dict:
+    """``{series: TrendFit}`` for every year-suffixed series in ``columns`` with ``min_years`` or more years."""
+    series = {}
+    for col in columns:
+        base, year = split_year(col)
+        if year is not None:
+            series.setdefault(base, {})[year] = col
+
+    fits = {}
+    for base, by_year in series.items():
+        if len(by_year) < min_years:
+            continue
+        years = sorted(by_year)
+        values = df[[by_year[y] for y in years]].to_numpy(dtype=np.float64, na_value=np.nan)
+        fits[base] = TrendFit(base, years, values, df.index)
+    return fits
@@ -0,0 +1,135 @@
+"""SQLite-backed store for model weights with per-model atomic writes."""
+import os
+import sqlite3
+from contextlib import contextmanager
+
+import pandas as pd
+
+from .scoring import WEIGHT_COLUMNS, normalise_weights, read_weights
+
+DB_PATH = os.path.join("data", "weights.sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    name TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+CREATE TABLE IF NOT EXISTS weights (
+    model TEXT NOT NULL REFERENCES models(name) ON DELETE CASCADE,
+    axis TEXT NOT NULL,
+    variable TEXT NOT NULL,
+    weight NUMERIC NOT NULL,
+    PRIMARY KEY (model, axis, variable)
+);
+CREATE INDEX IF NOT EXISTS idx_weights_model ON weights(model);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('revision', 0);
+"""
+
+
+class WeightsRepository:
+    """Upsert/delete/list/get of Model/Axis/Variable/Weight rows, one model at a time.
+
+    Every write runs in its own ``BEGIN IMMEDIATE`` transaction, so concurrent
+    analysts serialise on the database lock instead of overwriting each other,
+    and bumps a revision counter that callers can use as a cache key.
+    """
+
+    def __init__(self, path: str = DB_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA foreign_keys=ON")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'revision'")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    # ---- Reads ----
+    def revision(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()[0]
+
+    def list_models(self, source: str = None) -> list:
+        sql, args = "SELECT name FROM models", ()
+        if source is not None:
+            sql, args = sql + " WHERE source = ?", (source,)
+        with self._connect() as conn:
+            return [r[0] for r in conn.execute(sql + " ORDER BY rowid", args)]
+
+    def exists(self, model: str) -> bool:
+        with self._connect() as conn:
+            return conn.execute("SELECT 1 FROM models WHERE name = ?", (model,)).fetchone() is not None
+
+    def get(self, model: str) -> pd.DataFrame:
+        return self._query("WHERE w.model = ?", (model,))
+
+    def all(self, source: str = None) -> pd.DataFrame:
+        if source is None:
+            return self._query("", ())
+        return self._query("WHERE m.source = ?", (source,))
+
+    def _query(self, where: str, args: tuple) -> pd.DataFrame:
+        sql = (
+            "SELECT w.model AS Model, w.axis AS Axis, w.variable AS Variable, w.weight AS Weight "
+            f"FROM weights w JOIN models m ON m.name = w.model {where} ORDER BY m.rowid, w.rowid"
+        )
+        with self._connect() as conn:
+            return pd.read_sql_query(sql, conn, params=args)
+
+    # ---- Writes ----
+    def upsert(self, model: str, weights: pd.DataFrame, source: str = "custom") -> None:
+        """Replace all rows of ``model`` atomically. Refuses to overwrite a model of another source."""
+        weights = normalise_weights(weights.assign(Model=model))
+        rows = list(zip(weights["Model"], weights["Axis"], weights["Variable"], weights["Weight"].tolist()))
+        with self._transaction() as conn:
+            found = conn.execute("SELECT source FROM models WHERE name = ?", (model,)).fetchone()
+            if found is not None and found[0] != source:
+                raise ValueError(f"'{model}' is a {found[0]} model and cannot be overwritten.")
+            conn.execute("DELETE FROM weights WHERE model = ?", (model,))
+            conn.execute(
+                "INSERT INTO models (name, source) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET updated_at = datetime('now')",
+                (model, source),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO weights (model, axis, variable, weight) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def delete(self, model: str) -> bool:
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM models WHERE name = ?", (model,)).rowcount > 0
+
+    # ---- Import ----
+    def import_csv(self, path: str, source: str) -> list:
+        """One-time import of a weights CSV; models already in the store are left untouched."""
+        imported = []
+        for model, rows in read_weights(path).groupby("Model", sort=False):
+            if not self.exists(model):
+                self.upsert(model, rows[WEIGHT_COLUMNS], source=source)
+                imported.append(model)
+        return imported
@@ -0,0 +1,149 @@
+"""Year dimension: resolve year-suffixed variables and precompute scores for every year."""
+import re
+
+import numpy as np
+import pandas as pd
+
+from .jobs import report_progress
+from .scoring import AXES, WeightMatrix, axis_variables, score_matrix
+
+YEARS = [2025, 2026, 2027, 2028]
+
+_YEAR_SUFFIX = re.compile(r"^(?P<base>.+)_(?P<year>(?:19|20)\d{2})$")
+
+
+def split_year(column: str):
+    """``"Y_PEP_2023"`` → ``("Y_PEP", 2023)``; columns without a year suffix → ``(column, None)``."""
+    match = _YEAR_SUFFIX.match(str(column))
+    if match is None:
+        return column, None
+    return match.group("base"), int(match.group("year"))
+
+
+def resolve_year(available: list, year: int) -> int:
+    """Fallback rule for a variable without data for ``year``.
+
+    Use the most recent available year at or before ``year``; if the series only
+    starts later, use its earliest year.
+    """
+    earlier = [y for y in available if y <= year]
+    return max(earlier) if earlier else min(available)
+
+
+class YearIndex:
+    """Maps each (year, variable) pair to the dataset column that supplies it.
+
+    ``variables`` holds every scoring column as-is plus one base name per
+    year-suffixed series (e.g. ``Y_Government_debt``), so weights may target
+    either a specific year's column or the series that follows the selected year.
+    """
+
+    def __init__(self, columns: list, years: list = YEARS):
+        self.columns = list(columns)
+        self.years = [int(y) for y in years]
+
+        series = {}
+        for i, col in enumerate(self.columns):
+            base, y = split_year(col)
+            if y is not None:
+                series.setdefault(base, {})[y] = i
+
+        self.series = {base: sorted(by_year) for base, by_year in series.items()}
+        self.variables = self.columns + list(series)
+
+        n_cols = len(self.columns)
+        gather = np.tile(np.arange(len(self.variables)), (len(self.years), 1))
+        fallbacks = []
+        for j, (base, by_year) in enumerate(series.items(), start=n_cols):
+            for t, year in enumerate(self.years):
+                source = resolve_year(self.series[base], year)
+                gather[t, j] = by_year[source]
+                if source != year:
+                    fallbacks.append((base, year, source))
+        # gather[t, v] = column index supplying variable v in year t
+        self.gather = gather
+        self.fallbacks = pd.DataFrame(fallbacks, columns=["Variable", "Year", "SourceYear"])
+
+    def year_position(self, year) -> int:
+        return self.years.index(int(year))
+
+    def source_columns(self, year, variables: list) -> list:
+        """Dataset column supplying each of ``variables`` in ``year``."""
+        t = self.year_position(year)
+        position = {v: j for j, v in enumerate(self.variables)}
+        return [self.columns[self.gather[t, position[v]]] for v in variables]
+
+
+class ScoreTensor:
+    """Scores for every entity × year × model × axis, so year/model switches are slice lookups."""
+
+    def __init__(self, index: pd.Index, year_index: YearIndex, matrix: WeightMatrix, values: np.ndarray):
+        self.index = index
+        self.year_index = year_index
+        self.matrix = matrix
+        self.values = values  # (entities, years, models, axes)
+
+    @property
+    def years(self) -> list:
+        return self.year_index.years
+
+    @property
+    def models(self) -> list:
+        return self.matrix.models
+
+    def frame(self, model: str, year) -> pd.DataFrame:
+        """X/Y/Z scores of one model in one year."""
+        t = self.year_index.year_position(year)
+        m = self.matrix.models.index(model)
+        return pd.DataFrame(self.values[:, t, m, :], index=self.index, columns=AXES)
+
+    def to_long(self, models: list = None) -> pd.DataFrame:
+        """One row per entity × year × model with X/Y/Z columns (entity labels in the index)."""
+        models = list(self.models) if models is None else list(models)
+        m = [self.matrix.models.index(model) for model in models]
+        n, n_years = len(self.index), len(self.years)
+        block = self.values[:, :, m, :].reshape(-1, len(AXES))
+        out = pd.DataFrame(block, columns=AXES, index=self.index.repeat(n_years * len(m)))
+        out.insert(0, "Year", np.tile(np.repeat(np.asarray(self.years, dtype=np.int16), len(m)), n))
+        out.insert(0, "Model", pd.Categorical(np.tile(models, n * n_years), categories=models))
+        return out
+
+    def weighted_columns(self, model: str, year) -> list:
+        """Dataset columns a model-year's non-zero weights read from."""
+        used = self.matrix.values[self.matrix.models.index(model)].any(axis=0)
+        variables = [v for v, u in zip(self.matrix.variables, used) if u]
+        # Several variables can fall back to the same column for a year
+        return list(dict.fromkeys(self.year_index.source_columns(year, variables)))
+
+    def inputs(self, df: pd.DataFrame, model: str, year) -> tuple:
+        """``(values, weights, variables)`` behind one model-year's scores, limited to weighted variables.
+
+        ``values`` is entities × variables (NaN → 0, as in scoring) read from the
+        column supplying each variable in ``year``; ``weights`` is axes × variables.
+        """
+        weights = self.matrix.values[self.matrix.models.index(model)]
+        used = np.flatnonzero(weights.any(axis=0))
+        variables = [self.matrix.variables[j] for j in used]
+        columns = self.year_index.source_columns(year, variables)
+        values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        return np.nan_to_num(values, nan=0.0), weights[:, used], variables
+
+    def fallbacks(self, model: str, year) -> pd.DataFrame:
+        """Year-series the model weights whose value for ``year`` comes from another year."""
+        used = self.matrix.values[self.matrix.models.index(model)].any(axis=0)
+        names = {v for v, u in zip(self.matrix.variables, used) if u}
+        fb = self.year_index.fallbacks
+        return fb[(fb["Year"] == int(year)) & fb["Variable"].isin(names)].reset_index(drop=True)
+
+
+def score_tensor(df: pd.DataFrame, weights: pd.DataFrame, years: list = YEARS) -> ScoreTensor:
+    """Score all models for all years; one matrix product per year (progress reported per year in the job pool)."""
+    year_index = YearIndex(axis_variables(df), years)
+    matrix = WeightMatrix.from_frame(weights, year_index.variables)
+    values = df[year_index.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    out = np.empty((len(df), len(year_index.years), len(matrix.models), len(AXES)))
+    for t in range(len(year_index.years)):
+        out[:, t] = score_matrix(values[:, year_index.gather[t]], matrix.values)
+        report_progress((t + 1) / len(year_index.years))
+    return ScoreTensor(df.index, year_index, matrix, out)
@@ -1,11 +1,50 @@
 import streamlit as st
 import pandas as pd
-import plotly as pl
 import os
+import json
+import uuid
 import numpy as np
-import plotly.express as px
 from datetime import datetime
 
+from horizon import (
+    YEARS,
+    LiveScorer,
+    PrepPipeline,
+    WeightsRepository,
+    YearIndex,
+    axis_variables,
+    derive_fingerprint,
+    file_fingerprint,
+    frame_fingerprint,
+    load_dataset,
+    score_tensor,
+    variable_summary,
+)
+from horizon.drivers import DriverDecomposition
+from horizon.export import FORMATS, export_frame, export_path
+from horizon.ingest import ingest_csv
+from horizon.jobs import JobPool, report_progress
+from horizon.profiling import Profiler
+from horizon.clusters import cluster_labels, quadrant_labels
+from horizon.neighbors import METRICS, NeighborIndex
+from horizon.trends import fit_trends
+from horizon.rollup import STATS, RegionCube, region_labels, score_rollup, variable_rollup
+from horizon.sensitivity import weight_sensitivity
+from horizon.snapshots import SnapshotStore
+from horizon.session import DatasetView
+from horizon.charts import (
+    MAX_POINTS,
+    FigureCache,
+    bar_figure,
+    bubble_figure,
+    bubble_points,
+    level_of_detail,
+    line_figure,
+    map_figure,
+    pie_figure,
+    symmetric_limit,
+)
+
 # ----------------- MUST BE FIRST STREAMLIT CALL -----------------
 st.set_page_config(
     page_title="Horizon Scanning Dashboard",
@@ -14,38 +53,6 @@ st.set_page_config(
 )
 # ----------------------------------------------------------------
 
-# ---- Default action guessers ----
-def _likely_identifier(col_name: str) -> bool:
-    col = str(col_name).lower()
-    return any(k in col for k in ["id", "uuid", "guid", "email", "phone", "mobile", "account", "postcode", "zip", "ssn"])
-
-def _guess_action(col_name: str, s: pd.Series) -> str:
-    # Nothing there → do nothing
-    if s.dropna().empty:
-        return "None"
-
-    # Obvious IDs/keys → do nothing
-    if _likely_identifier(col_name):
-        return "None"
-
-    n = len(s)
-    nunique = s.nunique(dropna=True)
-
-    if np.issubdtype(s.dtype, np.number):
-        # Constant numeric → do nothing
-        if nunique <= 1:
-            return "None"
-        # Low-cardinality numeric (binary/few levels) → Encode
-        if nunique <= 2 or nunique <= max(10, int(0.03 * n)):
-            return "Encode"
-        # Otherwise treat as continuous → Standardize
-        return "Standardize"
-    else:
-        # Extremely high-cardinality text → do nothing
-        if nunique > max(100, int(0.5 * n)):
-            return "None"
-        return "Encode"
-
 # ----------------- DARK THEME CSS -----------------
 st.markdown(
     """
@@ -210,45 +217,237 @@ with hcol2:
 st.markdown("<hr style='opacity:0.25; margin-top:0.5rem;'>", unsafe_allow_html=True)
 # ====== END HEADER ======
 
-# Load raw dataset
+# Per-rerun section timings, off unless enabled in the sidebar (or HORIZON_PROFILE=1 for every session)
+st.session_state.setdefault("profiling", os.environ.get("HORIZON_PROFILE") == "1")
+st.session_state.setdefault("profiling_memory", False)
+profiler = Profiler(
+    enabled=st.session_state.profiling,
+    track_memory=st.session_state.profiling and st.session_state.profiling_memory,
+)
+
+# Load raw dataset (parsed once per file version and shared read-only across reruns/sessions)
+@st.cache_resource(show_spinner="Loading dataset...", max_entries=4)
+def _load_raw_data(path: str, fingerprint: str) -> pd.DataFrame:
+    return load_dataset(path)
+
 raw_data_path = os.path.join("data", "ALL_RAW.csv")
 if os.path.exists(raw_data_path):
-    raw_data = pd.read_csv(raw_data_path)
+    raw_data_fp = file_fingerprint(raw_data_path)
+    with profiler.section("load_dataset") as rec:
+        raw_data = _load_raw_data(raw_data_path, raw_data_fp)
+        rec["rows"], rec["columns"] = raw_data.shape
 else:
     st.warning("⚠️ data/ALL_RAW.csv not found. Using an empty DataFrame.")
+    raw_data_fp = "empty"
     raw_data = pd.DataFrame()
 
-# Keep a pristine copy for reset
-if "original_raw_data" not in st.session_state:
-    st.session_state.original_raw_data = raw_data.copy()
+# Summary stats + suggested actions, computed once per dataset version
+@st.cache_data(show_spinner=False, max_entries=8)
+def _variable_summary(fingerprint: str, _df: pd.DataFrame) -> pd.DataFrame:
+    return variable_summary(_df)
+
+# Session view over the shared dataset: Tab 2 transforms land in a per-session column overlay
+# (no copies of the base); the view's fingerprint keys the downstream caches
+if "dataset" not in st.session_state:
+    st.session_state.dataset = DatasetView(raw_data, raw_data_fp)
+elif st.session_state.dataset.base_fp != raw_data_fp:
+    st.session_state.dataset = DatasetView(raw_data, raw_data_fp)
+    st.info("ℹ️ The dataset changed on disk; processed data was reset.")
+
+# Model weights store; the CSVs seed it once when the database is first created
+preset_path = os.path.join("data", "model_weights.csv")
+custom_path = os.path.join("data", "custom_model_weights.csv")
+
+@st.cache_resource
+def _weights_repository() -> WeightsRepository:
+    repo = WeightsRepository()
+    if not repo.list_models():
+        repo.import_csv(preset_path, source="preset")
+        repo.import_csv(custom_path, source="custom")
+    return repo
+
+weights_repo = _weights_repository()
+
+# All weights, re-read only when the store's revision changes
+@st.cache_data(show_spinner=False, max_entries=8)
+def _all_weights(revision: int) -> pd.DataFrame:
+    return weights_repo.all()
+
+# Entities × years × models × axes, scored once per (processed data, weights) version
+# (runs in the job pool, which shows progress instead of a spinner)
+@st.cache_data(show_spinner=False, max_entries=16)
+def _score_tensor(data_fp: str, weights_fp: str, _df: pd.DataFrame, _weights: pd.DataFrame):
+    return score_tensor(_df, _weights, YEARS)
+
+# Monte Carlo rank/quadrant stability of one model-year, once per (data, weights, settings) version
+@st.cache_data(show_spinner="Sampling perturbed weights...", max_entries=8)
+def _weight_sensitivity(data_fp: str, weights_fp: str, model: str, year: str, samples: int, sigma: float,
+                        _df: pd.DataFrame, _scores, _labels: pd.DataFrame) -> pd.DataFrame:
+    values, weights, _ = _scores.inputs(_df, model, year)
+    result = weight_sensitivity(values, weights, samples=samples, sigma=sigma)
+    result.index = _df.index
+    if "Country" in _labels.columns:
+        result.insert(0, "Country", _labels["Country"].astype(str))
+    return result
+
+# Per-entity weight × value decomposition of one model-year, once per (data, weights) version
+@st.cache_data(show_spinner="Decomposing drivers...", max_entries=16)
+def _driver_decomposition(data_fp: str, weights_fp: str, model: str, year: str,
+                          _df: pd.DataFrame, _scores) -> DriverDecomposition:
+    values, weights, variables = _scores.inputs(_df, model, year)
+    return DriverDecomposition.from_inputs(values, weights, variables, _df.index)
+
+# Region rollup parts: variable stats per column block (the shared base once per server, a session's
+# transformed columns per processed version) and score stats per model, so edits rebuild only their part
+@st.cache_data(show_spinner=False, max_entries=16)
+def _region_variable_stats(fingerprint: str, columns: tuple, _df: pd.DataFrame, _regions: pd.Series) -> pd.DataFrame:
+    return variable_rollup(_df, list(columns), _regions)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _region_score_stats(data_fp: str, model_fp: str, model: str, _scores, _regions: pd.Series) -> pd.DataFrame:
+    m = _scores.models.index(model)
+    return score_rollup(_scores.values[:, :, m, :], _scores.years, _regions)
+
+# Slope/acceleration/projection fits of every year-suffixed series, once per data version
+@st.cache_data(show_spinner=False, max_entries=8)
+def _trend_fits(fingerprint: str, _df: pd.DataFrame) -> dict:
+    return fit_trends(_df, axis_variables(_df))
+
+# Similarity index over a column set, rebuilt only when the processed data or the column set changes
+@st.cache_data(show_spinner="Indexing profiles...", max_entries=8)
+def _neighbor_index(data_fp: str, columns: tuple, _df: pd.DataFrame, _labels: pd.Series) -> NeighborIndex:
+    return NeighborIndex.from_frame(_df, list(columns), labels=_labels)
+
+# Quadrant / k-means segments of one model-year's scores, once per (data, weights, segmentation) version
+@st.cache_data(show_spinner=False, max_entries=32)
+def _segments(data_fp: str, weights_fp: str, model: str, year: str, method: str, k: int, _points: pd.DataFrame):
+    return _segment(_points, method, k)
+
+def _segment(points: pd.DataFrame, method: str, k: int) -> pd.Series:
+    return quadrant_labels(points) if method == "Quadrant" else cluster_labels(points, k)
+
+# Shared across sessions so reruns triggered elsewhere reuse Tab 5's figures
+@st.cache_resource
+def _figure_cache() -> FigureCache:
+    return FigureCache()
+
+# One worker pool per server process: sessions submitting identical work share one in-flight job
+@st.cache_resource
+def _job_pool() -> JobPool:
+    return JobPool()
+
+job_pool = _job_pool()
+# Jobs finishing within this long are shown in the same rerun; longer ones get a polled progress bar
+JOB_INLINE_SECONDS = 1.0
+
+# Saved snapshots of processed data (column chunks deduplicated across snapshots and sessions)
+@st.cache_resource
+def _snapshot_store() -> SnapshotStore:
+    return SnapshotStore()
+
+# Which columns of a snapshot differ from the session's processed data, from chunk hashes only
+@st.cache_data(show_spinner="Comparing with snapshot...", max_entries=8)
+def _snapshot_diff(data_fp: str, snapshot_id: str, _df: pd.DataFrame) -> pd.DataFrame:
+    return _snapshot_store().open(snapshot_id).diff(_df)
+
+# Snapshot listing and store size, re-read only after a save or delete
+@st.cache_data(show_spinner=False, max_entries=1)
+def _snapshot_listing(revision: int) -> tuple:
+    store = _snapshot_store()
+    return store.list(), store.disk_bytes()
+
+# Selected snapshot columns, read once for both the comparison table and the preview
+@st.cache_data(show_spinner="Loading snapshot columns...", max_entries=8)
+def _snapshot_compare(data_fp: str, snapshot_id: str, columns: tuple, _df: pd.DataFrame) -> tuple:
+    snapshot = _snapshot_store().open(snapshot_id)
+    stored = snapshot.frame([c for c in columns if c in snapshot.columns])
+    return snapshot.compare(_df, list(columns), stored), stored.head()
 
 # Sidebar menu
 st.sidebar.title("Menu")
 st.sidebar.write("Add in buttons and sliders etc")
 sidebar_input = st.sidebar.text_input("Write something here to show in main page")
 
-# Define tab structure
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    "Horizon Scanning",
-    "Data Preparation",
-    "Model Selection",
-    "Chart",
-    "Results Drivers"
-])
+with st.sidebar.expander("🧮 Session memory"):
+    mem = st.session_state.dataset.memory_report()
+    st.write(f"Shared dataset: {mem['base_mb']:.1f} MB (one copy per server)")
+    st.write(f"This session: {mem['overlay_columns']} transformed columns, {mem['overlay_mb']:.2f} MB")
+    st.write(f"All sessions: {mem['sessions']} open, {mem['all_overlays_mb']:.2f} MB of overlays")
 
 # Sample data for Chart tab default
-np.random.seed(42)
-n = 30
-df = pd.DataFrame({
-    "X": np.random.uniform(-50, 50, n),
-    "Y": np.random.uniform(-50, 50, n),
-    "Z": np.random.uniform(10, 50, n),
-    "Category": np.random.choice(["Category A", "Category B", "Category C"], n),
-    "Label": [f"Point {i}" for i in range(n)]
-})
+@st.cache_data(show_spinner=False)
+def _sample_points() -> pd.DataFrame:
+    np.random.seed(42)
+    n = 30
+    return pd.DataFrame({
+        "X": np.random.uniform(-50, 50, n),
+        "Y": np.random.uniform(-50, 50, n),
+        "Z": np.random.uniform(10, 50, n),
+        "Category": np.random.choice(["Category A", "Category B", "Category C"], n),
+        "Label": [f"Point {i}" for i in range(n)]
+    })
+
+# ---- Shared state across views ----
+# Only the open tab runs (see the bottom of the script), and widgets that are not rendered lose
+# their state, so values other views need are kept under plain session-state keys.
+MODELS = ["Strategic Environment", "Technology", "Aviation", "Custom"]
+st.session_state.setdefault("selected_model", MODELS[0])
+st.session_state.setdefault("selected_year", str(YEARS[0]))
+st.session_state.setdefault("chart_model", MODELS[0])
+st.session_state.setdefault("upload", None)
+st.session_state.setdefault("selected_country", None)
+# Names this session's job groups, so its newer submissions supersede (cancel) its older ones
+st.session_state.setdefault("session_id", uuid.uuid4().hex)
+
+def _keep(key: str) -> None:
+    st.session_state[key] = st.session_state[f"_{key}"]
+
+def _persisted(key: str) -> dict:
+    """Widget kwargs that seed the widget from, and write it back to, ``st.session_state[key]``."""
+    st.session_state[f"_{key}"] = st.session_state[key]
+    return {"key": f"_{key}", "on_change": _keep, "args": (key,)}
+
+@st.fragment(run_every=1.0)
+def _job_progress(job):
+    """Polls a running pool job; one full rerun when it finishes stops the polling."""
+    if job.running:
+        st.progress(job.progress, text=f"{job.label}... {job.progress:.0%}")
+    else:
+        st.rerun()
+
+def _job_group(kind: str) -> str:
+    return f"{kind}:{st.session_state.session_id}"
+
+def _current_scores(data: pd.DataFrame = None, data_fp: str = None) -> tuple:
+    """Score tensor of the session's processed data (or ``data``) under all stored weights, plus its weights fingerprint.
+
+    Scoring runs in the job pool; while it is still running, or when it was
+    cancelled or failed, the tensor is ``None`` and a progress bar or status
+    message is shown in its place.
+    """
+    kind = "score" if data is None else "score-upload"
+    if data is None:
+        data, data_fp = st.session_state.dataset.frame(), st.session_state.dataset.fingerprint
+    weights_fp = f"weights-{weights_repo.revision()}"
+    with profiler.section("score_tensor", data):
+        job = job_pool.submit(
+            ("score", data_fp, weights_fp), _score_tensor,
+            data_fp, weights_fp, data, _all_weights(weights_repo.revision()),
+            group=_job_group(kind), label="Scoring models",
+        ).wait(JOB_INLINE_SECONDS)
+    if job.running:
+        _job_progress(job)
+        return None, weights_fp
+    if job.status == "cancelled":
+        st.info("Scoring cancelled; rerun to score the current weights.")
+        return None, weights_fp
+    if job.status == "failed":
+        st.error(f"Scoring failed: {job.error}")
+        return None, weights_fp
+    return job.result(), weights_fp
 
 # Tab 1: Horizon Scanning
-with tab1:
+def horizon_scanning_view():
     st.header("🌐 Horizon Scanning")
     st.markdown("""
     This section provides an overview of horizon scanning data, including structured and unstructured inputs.
@@ -263,49 +462,180 @@ with tab1:
     trends to their advantage.
     """)
     uploaded_file = st.file_uploader("Upload CSV data for scanning", type="csv")
-    if uploaded_file:
-        df = pd.read_csv(uploaded_file)
+    # Parsed in bounded-memory chunks once per uploaded file; later reruns reuse the session's copy
+    # (re-ingesting, or a st.cache_data copy, would hold the upload in memory twice)
+    upload_fp = f"upload-{uploaded_file.file_id}" if uploaded_file else None
+    if upload_fp and (st.session_state.upload is None or st.session_state.get("upload_fp") != upload_fp):
+        try:
+            with st.spinner("Reading upload..."):
+                uploaded_file.seek(0)
+                st.session_state.upload = ingest_csv(uploaded_file, expected_columns=axis_variables(raw_data))
+            st.session_state.upload_name = uploaded_file.name
+            st.session_state.upload_fp = upload_fp
+        except ValueError as e:
+            st.error(f"Upload rejected: {e}")
+
+    # Kept in session state so the Chart view still sees it after the uploader is unmounted
+    upload = st.session_state.upload
+    if upload is not None:
+        if uploaded_file is None:
+            st.caption(f"Using previously uploaded `{st.session_state.upload_name}`.")
+            if st.button("✖️ Clear upload"):
+                st.session_state.upload = None
+                st.rerun()
+        df = upload.frame
+        if upload.sampled:
+            st.info(
+                f"Upload exceeds the memory budget: kept every {upload.sample_step}th row "
+                f"({len(df):,} of {upload.rows_read:,}); the summary covers all rows."
+            )
+        if upload.missing_columns:
+            st.warning(f"Missing expected columns: {', '.join(upload.missing_columns)}")
+        if upload.unexpected_columns:
+            st.caption(f"Columns not in the reference dataset: {', '.join(upload.unexpected_columns)}")
+        for col, bad in upload.coerced.items():
+            st.warning(f"'{col}': {bad:,} non-numeric values treated as missing.")
         st.dataframe(df.head())
+        st.dataframe(upload.summary, hide_index=True)
 
     if sidebar_input:
         st.write(f"You have written: {sidebar_input}")
 
 # Tab 2: Data Preparation (with default action guesser + save + reset)
-with tab2:
-    st.header("Data Preparation")
+def _timed_summary() -> pd.DataFrame:
+    with profiler.section("variable_summary", raw_data):
+        return _variable_summary(raw_data_fp, raw_data)
+
+def _fit_and_transform(actions: pd.DataFrame, df: pd.DataFrame) -> tuple:
+    """Apply job: fit the Action table's pipeline on ``df`` and transform it (actions kept for snapshots)."""
+    pipeline = PrepPipeline.from_actions(actions).fit(df)
+    report_progress(0.5)
+    return pipeline, pipeline.transform(df), actions[["Variable", "Type", "Action"]]
+
+def _job_status(key: str, on_done, superseded_by: str) -> None:
+    """Progress of the session's job under ``key``; a finished one is reported once, then forgotten."""
+    job = st.session_state[key]
+    if job.running:
+        _job_progress(job)
+        return
+    st.session_state[key] = None
+    if job.status == "failed":
+        st.error(f"Failed: {job.label}: {job.error}")
+    elif job.status == "cancelled":
+        st.info(f"Cancelled: {job.label} (superseded by {superseded_by}).")
+    else:
+        on_done(job)
+
+def _apply_done(job):
+    """A finished Apply's result joins the processed data, unless that data changed meanwhile."""
+    if job.key[1] != st.session_state.dataset.fingerprint:
+        st.info("Processed data changed while applying; run **Apply** again.")
+        return
+    pipeline, transformed, actions = job.result()
+    st.session_state.dataset.apply(transformed, pipeline.standardize + pipeline.encode, pipeline.to_dict())
+    for _, reason in pipeline.skipped:
+        st.warning(reason)
+    st.session_state.prep_pipeline = pipeline
+    st.session_state.applied_actions = actions
+    st.success("Processing complete.")
+
+def _export_done(job):
+    saved = job.result()
+    st.session_state.pop("export_name", None)  # next run offers a fresh timestamped name
+    st.success(
+        f"✅ Saved {saved['rows']:,} rows to `{saved['path']}` ({saved['bytes'] / 1e6:.1f} MB, {job.seconds:.1f}s)"
+    )
+    if saved["sidecar_path"]:
+        st.caption(f"Pipeline saved to `{saved['sidecar_path']}` (re-apply here or with `python -m horizon.batch --pipeline`).")
+
+def _snapshot_metadata() -> dict:
+    """What produced the session's processed data: applied Action table, fitted pipeline and stored weights."""
+    actions = st.session_state.get("applied_actions")
+    pipeline = st.session_state.get("prep_pipeline")
+    weights = _all_weights(weights_repo.revision())
+    return {
+        "source": raw_data_path,
+        "source_fingerprint": st.session_state.dataset.base_fp,
+        "fingerprint": st.session_state.dataset.fingerprint,
+        "actions": json.loads(actions.to_json(orient="records")) if actions is not None else None,
+        "pipeline": pipeline.to_dict() if pipeline is not None else None,
+        "weights": {
+            "revision": weights_repo.revision(),
+            "fingerprint": frame_fingerprint(weights),
+            "table": json.loads(weights.to_json(orient="records")),
+        },
+    }
 
-    # ------ Build summary table with suggested actions ------
-    rows = []
-    for col in raw_data.columns:
-        s = raw_data[col]
-        if np.issubdtype(s.dtype, np.number):
-            row = {
-                "Variable": col,
-                "Type": "Numeric",
-                "Min": float(np.nanmin(s)) if s.notna().any() else None,
-                "Max": float(np.nanmax(s)) if s.notna().any() else None,
-                "Mean": float(np.nanmean(s)) if s.notna().any() else None,
-                "Std": float(np.nanstd(s)) if s.notna().any() else None,
-            }
+def _snapshot_done(job):
+    snapshot = job.result()
+    st.success(
+        f"📸 Snapshot `{snapshot.name}` ({snapshot.id}): {snapshot.manifest['new_bytes'] / 1e6:.2f} MB new, "
+        f"{snapshot.manifest['reused_chunks']:,} column chunks already stored ({job.seconds:.1f}s)"
+    )
+
+def _snapshots_panel():
+    """Past snapshots, their recorded actions/weights, and a lazy column-level comparison with the session."""
+    deleted = st.session_state.pop("snapshot_deleted", None)  # set just before the delete's rerun
+    if deleted:
+        st.success(deleted)
+    store = _snapshot_store()
+    listing, disk_bytes = _snapshot_listing(store.revision())
+    if listing.empty:
+        st.info("No snapshots yet; save one with **📸 Save snapshot**.")
+        return
+    st.dataframe(listing, hide_index=True, use_container_width=True,
+                 column_config={"New MB": st.column_config.NumberColumn(format="%.2f")})
+    st.caption(f"Store holds {disk_bytes / 1e6:.1f} MB of unique column chunks.")
+
+    ids = dict(zip(listing["Name"] + " · " + listing["Created"] + " · " + listing["ID"], listing["ID"]))
+    snapshot_id = ids[st.selectbox("Compare with snapshot", list(ids))]
+    snapshot = store.open(snapshot_id)
+    view = st.session_state.dataset
+    diff = _snapshot_diff(view.fingerprint, snapshot_id, view.frame())
+    counts = diff["Status"].value_counts()
+    st.caption(" · ".join(f"{n} {status}" for status, n in counts.items()) + " column(s) vs. current processed data.")
+
+    differing = diff.loc[diff["Status"] != "identical", "Column"].tolist()
+    columns = st.multiselect("Columns to compare (only these are loaded)", diff["Column"].tolist(),
+                             default=differing[:10], key=f"snapshot_columns_{snapshot_id}")
+    if columns:
+        table, preview = _snapshot_compare(view.fingerprint, snapshot_id, tuple(columns), view.frame())
+        st.dataframe(table, hide_index=True, use_container_width=True)
+        st.dataframe(preview, use_container_width=True)
+
+    with st.expander("Actions and weights recorded with this snapshot"):
+        actions = snapshot.actions()
+        if actions.empty:
+            st.caption("No Action table was applied before this snapshot.")
         else:
-            row = {
-                "Variable": col,
-                "Type": "Categorical",
-                "Min": "",
-                "Max": "",
-                "Mean": "",
-                "Std": "",
-            }
-        row["Action"] = _guess_action(col, s)
-        rows.append(row)
+            st.dataframe(actions, hide_index=True, use_container_width=True)
+        weights = snapshot.metadata.get("weights") or {}
+        st.caption(f"Weights store revision {weights.get('revision')} ({weights.get('fingerprint')}).")
+        st.dataframe(snapshot.weights(), hide_index=True, use_container_width=True)
 
-    summary_df = pd.DataFrame(rows)
+    if st.button("🗑️ Delete snapshot"):
+        removed = store.delete(snapshot_id)
+        st.session_state.snapshot_deleted = f"Deleted snapshot {snapshot_id} ({removed} unshared chunks removed)."
+        st.rerun()
+
+def data_preparation_view():
+    st.header("Data Preparation")
+
+    # ------ Build summary table with suggested actions ------
+    # On (re)entry the editor's own state is gone, so start from the last edited table for this dataset
+    if "var_summary_editor" not in st.session_state or st.session_state.get("action_table_fp") != raw_data_fp:
+        stored = st.session_state.get("action_table")
+        st.session_state.action_base = (
+            stored if stored is not None and st.session_state.get("action_table_fp") == raw_data_fp
+            else _timed_summary()
+        )
+    summary_df = st.session_state.action_base
 
     st.subheader("Variable Summary")
 
     left, right = st.columns([3, 1], vertical_alignment="top")
 
-    with left:
+    with left, profiler.section("data_editor", summary_df):
         edited = st.data_editor(
             summary_df,
             key="var_summary_editor",
@@ -318,103 +648,167 @@ with tab2:
                 )
             }
         )
+        st.session_state.action_table = edited
+        st.session_state.action_table_fp = raw_data_fp
 
     with right:
         st.markdown("### Process Variables")
         st.caption("Review/override **Action** in the table, then click **Apply**.")
         apply_clicked = st.button("Apply selected actions", use_container_width=True)
+        add_trends = st.button(
+            "➕ Add trend variables", use_container_width=True,
+            help="Adds <series>_slope and <series>_accel columns for each year-suffixed series "
+                 "(e.g. Y_Government_debt), fitted on the current processed data, for use in custom models."
+        )
 
         st.divider()
         st.markdown("### Save / Reset")
-        enable_save = st.checkbox("Enable save to CSV")
-        default_name = f"processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        save_name = st.text_input("Filename (saved to data/)", value=default_name, disabled=not enable_save)
-        do_save = st.button("💾 Save processed CSV", disabled=not enable_save, use_container_width=True)
+        enable_save = st.checkbox("Enable save")
+        snapshot_name = st.text_input("Snapshot name", value="processed", disabled=not enable_save)
+        do_snapshot = st.button(
+            "📸 Save snapshot", disabled=not enable_save, use_container_width=True,
+            help="Stores only columns not already saved, with the applied actions and weights; see Snapshots below."
+        )
+        with st.expander("Export a file copy"):
+            save_format = st.selectbox("Format", list(FORMATS), disabled=not enable_save,
+                                       help="Parquet/Feather keep dtypes and are much smaller and faster than CSV.")
+            # Timestamped default made once, and again after each finished export, so exports don't overwrite
+            st.session_state.setdefault("export_name", f"processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+            save_name = st.text_input("Filename (saved to data/)", disabled=not enable_save,
+                                      **_persisted("export_name"))
+            do_save = st.button("💾 Export file", disabled=not enable_save, use_container_width=True)
         do_reset = st.button("♻️ Reset to original", type="secondary", use_container_width=True)
 
-    # Initialize processed_data
-    if "processed_data" not in st.session_state:
-        st.session_state.processed_data = raw_data.copy()
+        st.divider()
+        st.markdown("### Re-apply saved pipeline")
+        saved_pipeline = st.file_uploader(
+            "Pipeline JSON (saved next to a processed CSV)", type="json",
+            help="Applies stored means/stds and category codes without refitting, so codes match the earlier run."
+        )
+        do_reapply = st.button("Apply saved pipeline", disabled=saved_pipeline is None, use_container_width=True)
 
-    # Apply actions
+    # Apply actions: compile the Action table into a fitted pipeline (kept for re-use on new extracts).
+    # Runs in the job pool; clicking again with other actions cancels the previous run
     if apply_clicked:
-        df_proc = st.session_state.processed_data.copy()
-
-        for _, row in edited.iterrows():
-            col = row["Variable"]
-            act = row["Action"]
-            typ = row["Type"]
-
-            if act == "Standardize":
-                if typ == "Numeric":
-                    series = df_proc[col]
-                    sd = series.std(skipna=True)
-                    if pd.notna(sd) and sd != 0:
-                        df_proc[col] = (series - series.mean(skipna=True)) / sd
-                    else:
-                        st.warning(f"Skipped standardizing '{col}' (std is 0 or NaN).")
-                else:
-                    st.warning(f"'{col}' is {typ}; standardize skipped.")
-
-            elif act == "Encode":
-                # Encode categoricals; for numeric low-cardinality, encode as strings → categories
-                if typ == "Categorical":
-                    df_proc[col] = df_proc[col].astype("category").cat.codes
-                else:
-                    df_proc[col] = df_proc[col].astype(str).astype("category").cat.codes
-
-            # 'None' → do nothing
-
-        st.session_state.processed_data = df_proc
-        st.success("Processing complete.")
-
-    # Save
-    if do_save:
-        os.makedirs("data", exist_ok=True)
-        target = os.path.join("data", save_name)
+        view = st.session_state.dataset
+        with profiler.section("apply", view.frame()):
+            st.session_state.apply_job = job_pool.submit(
+                ("apply", view.fingerprint, frame_fingerprint(edited)), _fit_and_transform, edited, view.frame(),
+                group=_job_group("apply"), label="Applying actions",
+            ).wait(JOB_INLINE_SECONDS)
+        _job_status("apply_job", _apply_done, "a newer Apply")
+
+    # Re-apply a stored pipeline: same category dictionaries, unseen values get the unknown code
+    if do_reapply:
         try:
-            st.session_state.processed_data.to_csv(target, index=False)
-            st.success(f"✅ Saved processed data to `{target}`")
-        except Exception as e:
-            st.error(f"Failed to save: {e}")
+            pipeline = PrepPipeline.from_dict(json.load(saved_pipeline))
+            transformed = pipeline.transform(st.session_state.dataset.frame())
+        except (ValueError, KeyError) as e:
+            st.error(f"Could not apply the saved pipeline: {e}")
+        else:
+            st.session_state.dataset.apply(transformed, pipeline.standardize + pipeline.encode, pipeline.to_dict())
+            st.session_state.prep_pipeline = pipeline
+            st.session_state.applied_actions = None  # stored pipeline only; no Action table behind it
+            unknown = {c: n for c, n in pipeline.encoder.unknown_counts(transformed).items() if n}
+            if unknown:
+                st.warning("Values not in the saved categories (coded -1): " + ", ".join(
+                    f"{c} ({n} rows)" for c, n in unknown.items()
+                ))
+            st.success("Saved pipeline applied.")
+
+    # Save: written in the job pool (temp file + rename), with the fitted pipeline alongside;
+    # a newer save from this session cancels one still running
+    if do_save:
+        view = st.session_state.dataset
+        pipeline = st.session_state.get("prep_pipeline")
+        path = export_path("data", save_name, save_format)
+        st.session_state.export_job = job_pool.submit(
+            ("export", path, save_format, view.fingerprint), export_frame, view.frame(), path, save_format,
+            sidecar=pipeline.to_dict() if pipeline is not None else None,
+            group=_job_group("export"), label=f"Saving `{path}`",
+        )
+        _job_status("export_job", _export_done, "a newer save")
+
+    # Snapshot: content-addressed, so unchanged columns are not written again
+    if do_snapshot:
+        view = st.session_state.dataset
+        metadata = _snapshot_metadata()
+        st.session_state.snapshot_job = job_pool.submit(
+            ("snapshot", derive_fingerprint(view.fingerprint, metadata)),
+            _snapshot_store().save, view.frame(), snapshot_name, metadata,
+            group=_job_group("snapshot"), label=f"Saving snapshot `{snapshot_name}`",
+        ).wait(JOB_INLINE_SECONDS)
+        _job_status("snapshot_job", _snapshot_done, "a newer snapshot")
+
+    # Derived trend variables join the session overlay, so scoring and Model Selection pick them up
+    if add_trends:
+        view = st.session_state.dataset
+        fits = _trend_fits(view.fingerprint, view.frame())
+        if fits:
+            derived = pd.concat([fit.derived_columns() for fit in fits.values()], axis=1)
+            view.apply(derived, list(derived.columns), {"trends": list(fits)})
+            st.success("Added trend variables: " + ", ".join(f"`{c}`" for c in derived.columns))
+        else:
+            st.info("No year-suffixed series with enough years to fit.")
 
     # Reset
     if do_reset:
-        st.session_state.processed_data = st.session_state.original_raw_data.copy()
+        if st.session_state.get("apply_job") is not None:
+            st.session_state.apply_job.cancel()
+            st.session_state.apply_job = None
+        st.session_state.dataset.reset()
+        st.session_state.prep_pipeline = None
+        st.session_state.applied_actions = None
         st.success("🔄 Reset processed data to original.")
 
     st.subheader("Processed Data Preview")
-    if not st.session_state.processed_data.empty:
-        st.dataframe(st.session_state.processed_data.head())
+    if not st.session_state.dataset.frame().empty:
+        st.dataframe(st.session_state.dataset.frame().head())
     else:
         st.info("Processed data is empty.")
 
+    st.subheader("📸 Snapshots")
+    _snapshots_panel()
+
 # Tab 3: Model Selection
-with tab3:
+def model_selection_view():
     st.header("🧠 Model Selection")
 
     # Load preset weights
-    preset_path = os.path.join("data", "model_weights.csv")
-    if os.path.exists(preset_path):
-        preset_df = pd.read_csv(preset_path)
-    else:
-        preset_df = pd.DataFrame(columns=["Model", "Axis", "Variable", "Weight"])
+    preset_df = _all_weights(weights_repo.revision())
 
     # Dropdowns
-    model = st.selectbox("Select a model:", ["Strategic Environment", "Technology", "Aviation", "Custom"])
-    year = st.selectbox("Select year:", ["2025", "2026", "2027", "2028"])
+    model = st.selectbox("Select a model:", MODELS, **_persisted("selected_model"))
+    year = st.selectbox("Select year:", [str(y) for y in YEARS], **_persisted("selected_year"))
+
+    # Model the Chart tab scores with (Custom → the loaded saved custom model, if any)
+    st.session_state.chart_model = None if model == "Custom" else model
 
     if model == "Custom":
         st.markdown("### ⚖️ Create a Custom Model")
 
         model_name = st.text_input("Enter a name for your custom model:", value="Custom_Aug2025")
 
-        x_vars = [f"X_Factor{i}" for i in range(1, 6)]
-        y_vars = [f"Y_Risk{i}" for i in range(1, 6)]
-        z_vars = [f"Z_Cap{i}" for i in range(1, 6)]
-
-        # One form, three columns: X, Y, Z
-        with st.form("custom_form"):
+        # Variables offered per axis: the processed data's own X_/Y_/Z_ series (placeholders if it has none)
+        year_index = YearIndex(axis_variables(st.session_state.dataset.frame()), YEARS)
+        axis_options = {
+            axis: [v for v in year_index.variables if v.startswith(f"{axis}_")] or default
+            for axis, default in [
+                ("X", [f"X_Factor{i}" for i in range(1, 6)]),
+                ("Y", [f"Y_Risk{i}" for i in range(1, 6)]),
+                ("Z", [f"Z_Cap{i}" for i in range(1, 6)]),
+            ]
+        }
+        vc_x, vc_y, vc_z = st.columns(3)
+        x_vars = vc_x.multiselect("X variables", axis_options["X"], default=axis_options["X"][:5])
+        y_vars = vc_y.multiselect("Y variables", axis_options["Y"], default=axis_options["Y"][:5])
+        z_vars = vc_z.multiselect("Z variables", axis_options["Z"], default=axis_options["Z"][:5])
+
+        # Live preview moves the sliders out of the form so each change reruns and rescores incrementally
+        live_preview = st.toggle("Live preview while adjusting weights", value=False)
+
+        # One form (or plain container when previewing), three columns: X, Y, Z
+        with (st.container() if live_preview else st.form("custom_form")):
             col_x, col_y, col_z = st.columns(3)
 
             with col_x:
@@ -429,9 +823,36 @@ with tab3:
                 st.subheader("🧪 Z Axis")
                 z_weights = {v: st.slider(f"{v}", 0, 10, 0, key=f"z_{v}") for v in z_vars}
 
-            submit = st.form_submit_button("💾 Save Custom Model")
-
-        custom_path = os.path.join("data", "custom_model_weights.csv")
+            if live_preview:
+                submit = st.button("💾 Save Custom Model")
+            else:
+                submit = st.form_submit_button("💾 Save Custom Model")
+
+        if live_preview:
+            processed = st.session_state.dataset.frame()
+            preview_vars = list(dict.fromkeys(
+                v for v in x_vars + y_vars + z_vars if v in year_index.variables
+            ))
+            if preview_vars:
+                # Rebuild contribution columns only when data/year/variable set change; sliders apply deltas
+                scorer_key = (st.session_state.dataset.fingerprint, year, tuple(preview_vars))
+                if st.session_state.get("live_scorer_key") != scorer_key:
+                    columns = year_index.source_columns(year, preview_vars)
+                    st.session_state.live_scorer = LiveScorer(
+                        processed[columns].to_numpy(dtype=np.float64, na_value=np.nan),
+                        preview_vars, processed.index
+                    )
+                    st.session_state.live_scorer_key = scorer_key
+                scorer = st.session_state.live_scorer
+                for axis, weights in [("X", x_weights), ("Y", y_weights), ("Z", z_weights)]:
+                    for v in preview_vars:
+                        scorer.set_weight(axis, v, weights.get(v, 0))
+                st.plotly_chart(
+                    bubble_figure(bubble_points(processed, scorer.frame()), title="Live preview", height=500),
+                    use_container_width=True
+                )
+            else:
+                st.info("None of the selected variables are in the processed data; nothing to preview.")
 
         if submit:
             rows = (
@@ -442,21 +863,22 @@ with tab3:
             new_df = pd.DataFrame(rows, columns=["Model", "Axis", "Variable", "Weight"])
 
             overwrite = True
-            if os.path.exists(custom_path):
-                existing = pd.read_csv(custom_path)
-                if model_name in existing["Model"].unique():
-                    overwrite = st.checkbox(f"⚠️ Model '{model_name}' exists. Overwrite?", value=False)
-
-                if overwrite:
-                    existing = existing[existing["Model"] != model_name]
-                    combined = pd.concat([existing, new_df], ignore_index=True)
-                    combined.to_csv(custom_path, index=False)
-                    st.success(f"✅ Saved and overwritten `{model_name}`.")
-                else:
-                    st.warning("❌ Save cancelled.")
+            exists = weights_repo.exists(model_name)
+            if exists:
+                overwrite = st.checkbox(f"⚠️ Model '{model_name}' exists. Overwrite?", value=False)
+
+            if overwrite:
+                try:
+                    weights_repo.upsert(model_name, new_df)
+                    if exists:
+                        st.success(f"✅ Saved and overwritten `{model_name}`.")
+                    else:
+                        st.success(f"✅ Custom model `{model_name}` saved!")
+                except ValueError as e:
+                    overwrite = False
+                    st.error(f"Failed to save: {e}")
             else:
-                new_df.to_csv(custom_path, index=False)
-                st.success(f"✅ Custom model `{model_name}` saved!")
+                st.warning("❌ Save cancelled.")
 
             if overwrite:
                 st.markdown("#### Saved Weights")
@@ -475,31 +897,30 @@ with tab3:
         st.divider()
         st.markdown("### 🗂️ Manage Saved Custom Models")
 
-        if os.path.exists(custom_path):
-            saved_df = pd.read_csv(custom_path)
-            models = saved_df["Model"].unique().tolist()
-            if models:
-                selected = st.selectbox("📂 Load a Saved Custom Model", models)
-                st.markdown(f"#### 🔍 Weights for `{selected}`")
-                c1, c2, c3 = st.columns(3)
-                with c1:
-                    st.write("X Axis")
-                    st.table(saved_df.query("Model == @selected and Axis == 'X'")[["Variable", "Weight"]])
-                with c2:
-                    st.write("Y Axis")
-                    st.table(saved_df.query("Model == @selected and Axis == 'Y'")[["Variable", "Weight"]])
-                with c3:
-                    st.write("Z Axis")
-                    st.table(saved_df.query("Model == @selected and Axis == 'Z'")[["Variable", "Weight"]])
-
-                if st.button(f"🗑️ Delete `{selected}`"):
-                    saved_df = saved_df[saved_df["Model"] != selected]
-                    saved_df.to_csv(custom_path, index=False)
-                    st.success(f"✅ Deleted model `{selected}`. Refresh to update.")
-            else:
-                st.info("No saved custom models.")
+        models = weights_repo.list_models(source="custom")
+        if models:
+            if st.session_state.get("selected_custom") not in models:
+                st.session_state.selected_custom = models[0]
+            selected = st.selectbox("📂 Load a Saved Custom Model", models, **_persisted("selected_custom"))
+            st.session_state.chart_model = selected
+            saved_df = weights_repo.get(selected)
+            st.markdown(f"#### 🔍 Weights for `{selected}`")
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                st.write("X Axis")
+                st.table(saved_df.query("Axis == 'X'")[["Variable", "Weight"]])
+            with c2:
+                st.write("Y Axis")
+                st.table(saved_df.query("Axis == 'Y'")[["Variable", "Weight"]])
+            with c3:
+                st.write("Z Axis")
+                st.table(saved_df.query("Axis == 'Z'")[["Variable", "Weight"]])
+
+            if st.button(f"🗑️ Delete `{selected}`"):
+                weights_repo.delete(selected)
+                st.success(f"✅ Deleted model `{selected}`. Refresh to update.")
         else:
-            st.info("No saved custom model file found.")
+            st.info("No saved custom models.")
 
     else:
         st.markdown(f"### 📋 Preconfigured Weights for `{model}` Model")
@@ -516,58 +937,230 @@ with tab3:
             st.table(mdf.query("Axis == 'Z'")[["Variable", "Weight"]])
 
 # Tab 4: Chart
-with tab4:
+def chart_view():
     st.header("📊 Chart")
     st.markdown("This section will display the 3D bubble chart once data and model selections are made.")
 
+    chart_model = st.session_state.chart_model
+    year = st.session_state.selected_year
+    upload = st.session_state.upload
+    df = _sample_points()
+
+    # Score the processed data (or the uploaded extract, as-is) under the selected model;
+    # unmatched models keep the sample points
+    if upload is not None:
+        data, data_fp = upload.frame, st.session_state.upload_fp
+        labels = data
+    else:
+        data, data_fp = st.session_state.dataset.frame(), st.session_state.dataset.fingerprint
+        labels = st.session_state.dataset.base  # raw Country/Region, even if Apply encoded them
+    scores, weights_fp = _current_scores(data, data_fp)
+    if scores is None:
+        return
+    scored = False
+    if chart_model in scores.models and scores.matrix.matched(chart_model):
+        df = bubble_points(labels, scores.frame(chart_model, year))
+        scored = True
+        source = f"uploaded `{st.session_state.upload_name}`" if upload is not None else "processed data"
+        st.caption(f"Scores for `{chart_model}` ({year}) on {source}.")
+        fallbacks = scores.fallbacks(chart_model, year)
+        if not fallbacks.empty:
+            st.caption("No data for this year, using nearest earlier (else earliest) year: " + ", ".join(
+                f"{v} → {y}" for v, y in zip(fallbacks["Variable"], fallbacks["SourceYear"])
+            ))
+        with st.expander("🎲 Weight sensitivity", expanded=False):
+            st.caption(
+                "Rescores the model under many randomly perturbed weight sets (each weight × log-normal noise) "
+                "and reports how far each entity's X/Y rank moves (90% interval) and how often it changes quadrant."
+            )
+            s1, s2 = st.columns(2)
+            samples = s1.select_slider("Samples", options=[250, 500, 1000, 2000, 5000], value=1000)
+            sigma = s2.slider("Weight noise (log-scale σ)", 0.05, 1.0, 0.25, 0.05)
+            if st.toggle("Run sensitivity analysis", key="sensitivity_on"):
+                with profiler.section("weight_sensitivity", data) as rec:
+                    sensitivity = _weight_sensitivity(
+                        data_fp, weights_fp, chart_model, year, samples, sigma, data, scores, labels
+                    )
+                    rec["rows"] = samples
+                flips = sensitivity["Flip probability"]
+                st.caption(f"{int((flips > 0.1).sum())} of {len(flips)} entities change quadrant in more than 10% of samples.")
+                st.dataframe(
+                    sensitivity.sort_values("Flip probability", ascending=False),
+                    hide_index=True,
+                    column_config={"Flip probability": st.column_config.ProgressColumn(min_value=0.0, max_value=1.0, format="%.2f")},
+                )
+    elif chart_model is not None:
+        st.info(f"`{chart_model}` weights match none of the dataset's X/Y/Z variables; showing sample data.")
+
+    if "Size" not in df.columns and "Z" in df.columns:
+        df = df.assign(Size=df["Z"])
+
+    # Colour/filter by Region (default), score quadrant or k-means cluster
+    st.session_state.setdefault("segment_by", "Region")
+    s1, s2 = st.columns([3, 1])
+    segment_by = s1.radio("Category", ["Region", "Quadrant", "Clusters"], horizontal=True, **_persisted("segment_by"))
+    if segment_by != "Region" and {"X", "Y"} <= set(df.columns):
+        k = int(s2.number_input("Clusters", min_value=2, max_value=12, value=4)) if segment_by == "Clusters" else 0
+        with profiler.section("segments", df):
+            if scored:
+                segments = _segments(data_fp, weights_fp, chart_model, year, segment_by, k, df)
+            else:
+                segments = _segment(df, segment_by, k)
+        df = df.assign(Category=segments.to_numpy())
+
     # Category guard
     if "Category" in df.columns:
-        categories = df["Category"].unique().tolist()
+        categories = sorted(df["Category"].astype(str).unique().tolist())
         selected_cats = st.multiselect("Select Categories:", categories, default=categories)
-        filtered_df = df[df["Category"].isin(selected_cats)]
+        filtered_df = df[df["Category"].astype(str).isin(selected_cats)]
     else:
         st.info("No 'Category' column found; showing all points.")
         filtered_df = df
 
-    # Create bubble chart
-    fig = px.scatter(
-        filtered_df,
-        x="X", y="Y", size="Z", color=filtered_df["Category"] if "Category" in filtered_df.columns else None,
-        hover_name="Label", size_max=40
-    )
-
-    # Update layout for quadrants
-    fig.update_layout(
-        title="Interactive Bubble Chart (Quadrants)",
-        xaxis=dict(
-            range=[-50, 50],
-            zeroline=True,
-            zerolinewidth=2,
-            zerolinecolor='gray',
-            title="X Axis",
-            showgrid=False
-        ),
-        yaxis=dict(
-            range=[-50, 50],
-            zeroline=True,
-            zerolinewidth=2,
-            zerolinecolor='gray',
-            title="Y Axis",
-            showgrid=False
-        ),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        height=800,
-    )
+    # View window: large sets are binned server-side; narrowing the window refines to individual points
+    axis_lim = symmetric_limit(filtered_df)
+    x_range, y_range = (-axis_lim, axis_lim), (-axis_lim, axis_lim)
+    if len(filtered_df) > MAX_POINTS:
+        with st.expander("🔎 View window", expanded=False):
+            x_range = st.slider("X range", -axis_lim, axis_lim, x_range)
+            y_range = st.slider("Y range", -axis_lim, axis_lim, y_range)
+    with profiler.section("level_of_detail", filtered_df):
+        chart_points, binned = level_of_detail(filtered_df, x_range, y_range)
+    if binned:
+        st.caption(
+            f"{len(filtered_df):,} entities shown as {len(chart_points):,} grid bins; "
+            "narrow the view window to see individual points."
+        )
 
-    # Show chart
-    st.plotly_chart(fig, use_container_width=True)
+    # Create bubble chart (WebGL for large point counts)
+    with profiler.section("bubble_figure", chart_points):
+        fig = bubble_figure(chart_points, x_range=x_range, y_range=y_range)
+
+    # Show chart; clicking a scored entity of the processed data selects it for Results Drivers
+    if scored and upload is None:
+        event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", selection_mode="points",
+                                key="bubble_chart")
+        labels = set(df["Label"])
+        picked = [p["customdata"][0] for p in event.selection.points if p.get("customdata", [None])[0] in labels]
+        if picked:
+            st.session_state.selected_country = picked[0]
+            st.caption(f"Selected **{picked[0]}**; open Results Drivers to see what drives its scores.")
+    else:
+        st.plotly_chart(fig, use_container_width=True)
 
 # Tab 5: Results Drivers
-with tab5:
+def _region_cube(models: list, scores) -> RegionCube:
+    """Region cube for the session's processed data, with score stats for ``models``."""
+    view = st.session_state.dataset
+    regions = region_labels(view.base)  # raw labels, even if Region itself was encoded
+    base_stats = _region_variable_stats(view.base_fp, tuple(view.base.columns), view.base, regions)
+    overlay_stats = None
+    if view.overlay:
+        overlay_stats = _region_variable_stats(view.fingerprint, tuple(view.overlay), view.frame(), regions)
+
+    weights = _all_weights(weights_repo.revision())
+    score_stats = {}
+    for model in models:
+        if model in scores.models and scores.matrix.matched(model):
+            model_fp = frame_fingerprint(weights[weights["Model"] == model].reset_index(drop=True))
+            score_stats[model] = _region_score_stats(view.fingerprint, model_fp, model, scores, regions)
+    return RegionCube.combine(base_stats, overlay_stats, score_stats)
+
+def _region_comparison(cube: RegionCube) -> None:
+    """Region-level score and variable statistics, read from the precomputed cube."""
+    model, year = st.session_state.chart_model, st.session_state.selected_year
+    stat = st.selectbox("Statistic", [s for s in STATS if s != "count"], key="region_stat")
+    if model in cube.scores:
+        table = cube.score_stats(model, year, stat).join(cube.counts().rename("Entities"))
+        st.caption(f"{stat.title()} `{model}` axis scores by Region ({year}).")
+        st.dataframe(table, use_container_width=True)
+    variables = cube.variables.columns.get_level_values(0).unique().tolist()
+    if variables:
+        variable = st.selectbox("Variable", variables, key="region_variable")
+        st.dataframe(cube.variable_stats(variable), use_container_width=True)
+
+def _drivers_panel(figure_cache: FigureCache, scores, weights_fp: str) -> None:
+    """Top positive/negative weight × value terms behind the selected country's scores."""
+    model, year = st.session_state.chart_model, st.session_state.selected_year
+    view = st.session_state.dataset
+    data = view.frame()
+    if model not in scores.models or not scores.matrix.matched(model) or "Country" not in view.base.columns:
+        st.info(f"`{model}` weights match none of the dataset's X/Y/Z variables; no drivers to show.")
+        return
+
+    with profiler.section("driver_decomposition", data):
+        decomposition = _driver_decomposition(view.fingerprint, weights_fp, model, year, data, scores)
+    countries = view.base["Country"].astype(str).tolist()  # raw names, even if Country was encoded
+    if st.session_state.selected_country not in countries:
+        st.session_state.selected_country = countries[0]
+    country = st.selectbox("Country", countries, **_persisted("selected_country"))
+
+    drivers = decomposition.drivers(data.index[countries.index(country)])
+    st.caption(f"Largest contributions to `{model}` ({year}) axis scores; click a bubble in Chart to switch country.")
+    if drivers.empty:
+        st.info(f"No non-zero contributions for {country}.")
+    else:
+        st.plotly_chart(figure_cache.get(bar_figure, drivers, height=420), use_container_width=True)
+
+def _trend_panel(figure_cache: FigureCache) -> None:
+    """Raw year series of the selected country with its least-squares fit and projection."""
+    view = st.session_state.dataset
+    with profiler.section("trend_fits", view.base):
+        fits = _trend_fits(view.base_fp, view.base)
+    if not fits or "Country" not in view.base.columns:
+        st.info("The dataset has no year-suffixed series to trend.")
+        return
+
+    series = st.selectbox("Series", list(fits), key="trend_series") if len(fits) > 1 else next(iter(fits))
+    fit = fits[series]
+    countries = view.base["Country"].astype(str).tolist()
+    country = st.session_state.selected_country if st.session_state.selected_country in countries else countries[0]
+    row = countries.index(country)
+    line_df = fit.history(view.base.index[row])
+    st.caption(
+        f"`{series}` for **{country}**: slope {fit.slope[row]:,.4g}/yr, "
+        f"acceleration {fit.acceleration[row]:,.4g}/yr²; projection extends the linear fit."
+    )
+    st.plotly_chart(figure_cache.get(line_figure, line_df, height=420, y_title=series), use_container_width=True)
+
+def _similar_countries(scores) -> None:
+    """Top-k entities with the most similar processed X/Y/Z profile to the selected country."""
+    view = st.session_state.dataset
+    data = view.frame()
+    if "Country" not in view.base.columns or len(data) < 2:
+        st.info("Need a Country column and at least two entities to compare.")
+        return
+
+    model, year = st.session_state.chart_model, st.session_state.selected_year
+    columns = axis_variables(data)
+    n1, n2, n3 = st.columns([1, 1, 2])
+    k = n1.number_input("Neighbours", min_value=1, max_value=len(data) - 1, value=min(10, len(data) - 1))
+    metric = n2.radio("Metric", METRICS, horizontal=True)
+    if model in scores.models and scores.matrix.matched(model):
+        if n3.toggle(f"Only `{model}`'s weighted variables", key="similar_model_only"):
+            columns = scores.weighted_columns(model, year)
+    if not columns:
+        st.info("No X/Y/Z variables to compare.")
+        return
+
+    with profiler.section("neighbors", data):
+        # Raw names from the base, even if Apply encoded Country
+        index = _neighbor_index(view.fingerprint, tuple(columns), data, view.base["Country"].astype(str))
+        countries = index.labels
+        country = st.session_state.selected_country if st.session_state.selected_country in countries else countries[0]
+        similar = index.query(country, int(k), metric)
+    st.caption(f"Entities most like **{country}** across {len(columns)} standardised variables ({metric}).")
+    st.dataframe(similar, hide_index=True, use_container_width=True)
+
+def results_drivers_view():
     st.header("🔍 Results Drivers")
     st.markdown("Explore the key drivers behind results by geography and metric.")
 
+    # Every panel below reads the score tensor; fetch it once per rerun (None while still scoring)
+    scores, weights_fp = _current_scores()
+    if scores is None:
+        return
+
     # Dummy data (replace with your real data)
     map_df = pd.DataFrame({
         "Region": ["Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide"],
@@ -576,69 +1169,84 @@ with tab5:
         "value": [50, 70, 40, 55, 35]
     })
 
-    bar_df = pd.DataFrame({
-        "Driver": [f"Driver {i}" for i in range(1, 6)],
-        "Contribution": [30, 45, 20, 55, 40]
-    })
-
-    line_df = pd.DataFrame({
-        "Month": [f"2025-{m:02d}" for m in range(1, 13)],
-        "Index": [80, 82, 79, 85, 88, 90, 87, 92, 95, 97, 99, 101]
-    })
+    with profiler.section("region_cube", st.session_state.dataset.frame()):
+        cube = _region_cube([st.session_state.chart_model], scores)
+    counts = cube.counts()
+    pie_df = pd.DataFrame({"Category": counts.index.astype(str), "Share": counts.to_numpy()})
 
-    pie_df = pd.DataFrame({
-        "Category": ["A", "B", "C", "D"],
-        "Share": [35, 25, 20, 20]
-    })
+    # Figures are built once per input and shared (dark template applied at build time)
+    figure_cache = _figure_cache()
 
     # Layout: row 1 (Map | Bar)
     c1, c2 = st.columns(2)
 
     with c1:
         st.subheader("🗺️ Map (placeholder)")
-        fig_map = px.scatter_mapbox(
-            map_df, lat="lat", lon="lon", size="value", color="Region",
-            hover_name="Region", zoom=3, height=420
-        )
-        fig_map.update_layout(mapbox_style="open-street-map", margin=dict(l=0, r=0, t=0, b=0))
+        fig_map = figure_cache.get(map_figure, map_df, height=420)
         st.plotly_chart(fig_map, use_container_width=True)
 
     with c2:
-        st.subheader("📊 Bar Chart (placeholder)")
-        fig_bar = px.bar(
-            bar_df, x="Driver", y="Contribution", text="Contribution",
-            title=None, template="plotly_dark"
-        )
-        fig_bar.update_traces(textposition="outside")
-        fig_bar.update_layout(yaxis_title="Contribution", xaxis_title="Driver", height=420)
-        st.plotly_chart(fig_bar, use_container_width=True)
+        st.subheader("📊 Drivers")
+        _drivers_panel(figure_cache, scores, weights_fp)
 
     # Layout: row 2 (Line | Pie)
     c3, c4 = st.columns(2)
 
     with c3:
-        st.subheader("📈 Line Chart (placeholder)")
-        fig_line = px.line(
-            line_df, x="Month", y="Index", markers=True, title=None, template="plotly_dark"
-        )
-        fig_line.update_layout(yaxis_title="Index", xaxis_title="Month", height=420)
-        st.plotly_chart(fig_line, use_container_width=True)
+        st.subheader("📈 Trajectory")
+        _trend_panel(figure_cache)
 
     with c4:
-        st.subheader("🥧 Pie Chart (placeholder)")
-        fig_pie = px.pie(
-            pie_df, names="Category", values="Share", hole=0.3 , template="plotly_dark"
-        )
-        fig_pie.update_layout(height=420)
+        st.subheader("🥧 Entities by Region")
+        fig_pie = figure_cache.get(pie_figure, pie_df, height=420)
         st.plotly_chart(fig_pie, use_container_width=True)
 
-# Apply dark theme to all plots created in Tab 5 (safe even if already dark)
-try:
-    for f in [fig_map, fig_bar, fig_line, fig_pie]:
-        f.update_layout(template="plotly_dark")
-except NameError:
-    # If tab hasn't been rendered or variables not in scope, ignore
-    pass
+    st.subheader("🧊 Region comparison")
+    _region_comparison(cube)
+
+    st.subheader("🧭 Countries like this")
+    _similar_countries(scores)
+
+# Jobs still pending from earlier reruns are polled and finished here, before the open view runs,
+# so a finished Apply reaches the processed data whichever tab is open
+BACKGROUND_JOBS = [
+    ("apply_job", _apply_done, "a newer Apply"),
+    ("export_job", _export_done, "a newer save"),
+    ("snapshot_job", _snapshot_done, "a newer snapshot"),
+]
+with st.sidebar:
+    for key, on_done, superseded_by in BACKGROUND_JOBS:
+        if st.session_state.get(key) is not None:
+            _job_status(key, on_done, superseded_by)
+
+# Define tab structure; only the open tab's view runs on each rerun
+VIEWS = {
+    "Horizon Scanning": horizon_scanning_view,
+    "Data Preparation": data_preparation_view,
+    "Model Selection": model_selection_view,
+    "Chart": chart_view,
+    "Results Drivers": results_drivers_view,
+}
+for tab, view in zip(st.tabs(list(VIEWS), key="active_view", on_change="rerun"), VIEWS.values()):
+    if tab.open:
+        with tab, profiler.section(f"view:{view.__name__}"):
+            view()
+
+# Profiling panel + export (records from this rerun only)
+with st.sidebar.expander("⏱️ Profiling", expanded=st.session_state.profiling):
+    st.toggle("Record section timings", key="profiling")
+    st.toggle("Track allocations (slower)", key="profiling_memory", disabled=not st.session_state.profiling)
+    if profiler.enabled:
+        timings = profiler.to_frame()
+        st.dataframe(
+            timings.assign(section=timings["depth"].map(lambda d: "· " * d) + timings["section"]).drop(columns="depth"),
+            hide_index=True,
+            column_config={"seconds": st.column_config.NumberColumn(format="%.4f")},
+        )
+        profiler.append_jsonl(view=st.session_state.get("active_view"))
+        profiler.write_prometheus()
+        st.caption("Appended to `data/.profile/timings.jsonl`; latest run in `data/.profile/horizon.prom`.")
+profiler.close()
 
 # Optional image example
 # st.image(os.path.join(os.getcwd(), "static", "green_red_gradient.png"))
\ No newline at end of file
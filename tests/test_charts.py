@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from horizon.charts import MAX_POINTS, level_of_detail
+
+
+def _points(n: int, regions: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "X": rng.normal(size=n), "Y": rng.normal(size=n), "Z": rng.normal(size=n), "Size": np.ones(n),
+        "Category": rng.integers(regions, size=n).astype(str), "Label": np.arange(n).astype(str),
+    })
+
+
+@pytest.mark.parametrize("n, regions", [(20_000, 10), (100_000, 10), (100_000, 40)])
+def test_binned_points_stay_within_max_points(n, regions):
+    chart, binned = level_of_detail(_points(n, regions))
+
+    assert binned
+    assert len(chart) <= MAX_POINTS
+    assert chart["Count"].sum() == n
+
+
+def test_small_views_keep_raw_points():
+    points = _points(1_000, 10)
+
+    chart, binned = level_of_detail(points)
+
+    assert not binned
+    assert len(chart) == len(points)
@@ -0,0 +1,27 @@
+import os
+
+from horizon.data import load_dataset
+
+
+def _cached(cache_dir):
+    return sorted(os.listdir(cache_dir))
+
+
+def test_side_caches_of_similarly_named_files_survive(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    for name in ["extract-2024.csv", "extract.csv", "other/extract.csv"]:
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text("Country,a\nX,1\n")
+        load_dataset(str(tmp_path / name), cache_dir)
+
+    assert len(_cached(cache_dir)) == 3
+
+
+def test_reloading_a_changed_file_replaces_its_side_cache(tmp_path):
+    cache_dir, path = str(tmp_path / "cache"), tmp_path / "extract.csv"
+    path.write_text("Country,a\nX,1\n")
+    load_dataset(str(path), cache_dir)
+    path.write_text("Country,a\nX,1\nY,2\n")
+
+    assert len(load_dataset(str(path), cache_dir)) == 2
+    assert len(_cached(cache_dir)) == 1
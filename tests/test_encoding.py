@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+from horizon.encoding import UNKNOWN_CODE, CategoryEncoder
+
+
+def test_int_column_that_turns_float_keeps_its_codes():
+    encoder = CategoryEncoder().fit(pd.DataFrame({"c": [1, 0, 1]}), ["c"])
+    restored = CategoryEncoder.from_dict(encoder.to_dict())
+
+    codes = restored.transform(pd.DataFrame({"c": [1, np.nan, 0, 1]}))["c"].tolist()
+
+    assert encoder.categories == {"c": ["0", "1"]}
+    assert codes == [1, UNKNOWN_CODE, 0, 1]
+
+
+def test_float_column_that_turns_int_keeps_its_codes():
+    encoder = CategoryEncoder().fit(pd.DataFrame({"c": [2.0, np.nan, 3.5]}), ["c"])
+
+    codes = encoder.transform(pd.DataFrame({"c": [3, 2]}))["c"].tolist()
+
+    assert codes == [UNKNOWN_CODE, 0]
+    assert encoder.transform(pd.DataFrame({"c": [3.5, 2.0]}))["c"].tolist() == [1, 0]
+
+
+def test_dictionary_with_float_text_labels_still_matches():
+    encoder = CategoryEncoder({"c": ["0.0", "1.0"]})
+
+    assert encoder.transform(pd.DataFrame({"c": [1.0, 0.0, np.nan]}))["c"].tolist() == [1, 0, UNKNOWN_CODE]
@@ -0,0 +1,16 @@
+import io
+
+from horizon.ingest import ingest_csv
+
+
+def test_column_empty_in_first_chunk_and_text_later_becomes_categorical():
+    rows = ["Country,X_a,Notes"] + [f"C{i},{i}," for i in range(10)] + [f"C{i},{i},see memo" for i in range(10, 15)]
+
+    result = ingest_csv(io.StringIO("\n".join(rows)), chunk_rows=10)
+
+    summary = result.summary.set_index("Variable")
+    assert summary.loc["Notes", "Type"] == "Categorical"
+    assert summary.loc["Notes", "Missing"] == 10
+    assert summary.loc["X_a", "Type"] == "Numeric"
+    assert (summary.loc["X_a", "Min"], summary.loc["X_a", "Max"]) == (0, 14)
+    assert result.frame["Notes"].tolist()[-1] == "see memo"
@@ -0,0 +1,26 @@
+import threading
+
+from horizon.jobs import JobPool, report_progress
+
+
+def _until(event):
+    while not event.wait(0.01):
+        report_progress(0.5)
+    return "done"
+
+
+def test_resubmitting_a_superseded_key_starts_a_new_job():
+    pool = JobPool(max_workers=2)
+    release = threading.Event()
+    try:
+        first = pool.submit("A", _until, release, group="g")
+        pool.submit("B", _until, release, group="g")
+        again = pool.submit("A", _until, release, group="g")
+        cancelled = first.wait(5).status
+        release.set()
+
+        assert cancelled == "cancelled"
+        assert again is not first
+        assert again.result(timeout=5) == "done"
+    finally:
+        pool.shutdown()
@@ -0,0 +1,44 @@
+import json
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from horizon.encoding import UNKNOWN_CODE
+from horizon.prep import PrepPipeline
+
+
+def _actions(*rows):
+    return pd.DataFrame(rows, columns=["Variable", "Type", "Action"])
+
+
+def test_fit_learns_means_stds_and_skips_constant_and_text_columns():
+    df = pd.DataFrame({"x": [1.0, 2.0, 3.0], "flat": [5.0, 5.0, 5.0], "region": ["N", "S", "N"]})
+    pipeline = PrepPipeline.from_actions(_actions(
+        ("x", "Numeric", "Standardize"),
+        ("flat", "Numeric", "Standardize"),
+        ("region", "Categorical", "Standardize"),
+    )).fit(df)
+
+    assert pipeline.standardize == ["x"]
+    assert pipeline.means == {"x": 2.0} and pipeline.stds == {"x": 1.0}
+    assert [col for col, _ in pipeline.skipped] == ["region", "flat"]
+    np.testing.assert_allclose(pipeline.transform(df)["x"], [-1.0, 0.0, 1.0])
+
+
+def test_saved_pipeline_transforms_a_new_extract_like_the_fitted_one():
+    fitted_on = pd.DataFrame({"x": [1.0, 2.0, 3.0, 6.0], "region": ["N", "S", "N", "E"], "keep": [1, 2, 3, 4]})
+    pipeline = PrepPipeline.from_actions(_actions(
+        ("x", "Numeric", "Standardize"),
+        ("region", "Categorical", "Encode"),
+        ("keep", "Numeric", "None"),
+    )).fit(fitted_on)
+    restored = PrepPipeline.from_dict(json.loads(json.dumps(pipeline.to_dict())))
+
+    extract = pd.DataFrame({"x": [4.0, np.nan], "region": ["S", "W"], "keep": [7, 8]})
+    out = restored.transform(extract)
+
+    assert_frame_equal(out, pipeline.transform(extract))
+    assert restored.to_dict() == pipeline.to_dict()
+    assert out["region"].iloc[1] == UNKNOWN_CODE
+    assert out["keep"].tolist() == [7, 8]
@@ -0,0 +1,13 @@
+import pandas as pd
+
+from horizon.rollup import RegionCube, region_labels, variable_rollup
+
+
+def test_cube_without_numeric_columns_has_no_counts():
+    df = pd.DataFrame({"Country": ["A", "B"], "Region": ["X", "Y"]})
+    variables = variable_rollup(df, ["Country"], region_labels(df))
+    cube = RegionCube.combine(variables, None, {})
+
+    assert variables.columns.nlevels == 2
+    assert cube.counts().empty
+    assert cube.variables.columns.get_level_values(0).unique().tolist() == []
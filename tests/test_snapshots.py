@@ -0,0 +1,21 @@
+import pandas as pd
+
+from horizon.snapshots import SnapshotStore
+
+
+def test_diff_uses_the_snapshot_chunk_size(tmp_path):
+    df = pd.DataFrame({"a": range(250), "b": [float(i) / 3 for i in range(250)]})
+    snapshot = SnapshotStore(str(tmp_path), chunk_rows=100).save(df, "small chunks")
+
+    assert (snapshot.diff(df)["Status"] == "identical").all()
+    assert SnapshotStore(str(tmp_path)).open(snapshot.id).chunk_rows == 100
+
+
+def test_revision_changes_on_save_and_delete(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    empty = store.revision()
+    snapshot = store.save(pd.DataFrame({"a": [1, 2]}), "one")
+    saved = store.revision()
+    store.delete(snapshot.id)
+
+    assert len({empty, saved, store.revision()}) == 3
@@ -0,0 +1,17 @@
+import warnings
+
+import numpy as np
+
+from horizon.summary import numeric_stats
+
+
+def test_constant_infinite_column_has_one_unique_value():
+    values = np.array([[np.inf, -np.inf, 1.0], [np.inf, -np.inf, 2.0], [np.inf, -np.inf, np.nan]])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        stats = numeric_stats(values)
+
+    assert stats["nunique"].tolist() == [1, 1, 2]
+    assert np.isnan(stats["std"][:2]).all()
+    assert stats["std"][2] == 0.5
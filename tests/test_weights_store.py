@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from horizon.weights_store import WeightsRepository
+
+
+def _weights(*rows):
+    return pd.DataFrame(rows, columns=["Axis", "Variable", "Weight"])
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return WeightsRepository(str(tmp_path / "weights.sqlite"))
+
+
+def test_upsert_replaces_only_that_models_rows(repo):
+    repo.upsert("A", _weights(("X", "X_a", 1), ("Y", "Y_b", 2)))
+    repo.upsert("B", _weights(("X", "X_a", 3)))
+    repo.upsert("A", _weights(("Z", "Z_c", 4)))
+
+    assert repo.get("A")[["Axis", "Variable", "Weight"]].values.tolist() == [["Z", "Z_c", 4]]
+    assert repo.get("B")["Weight"].tolist() == [3]
+    assert repo.list_models() == ["A", "B"]
+
+
+def test_delete_removes_the_model_and_its_weights(repo):
+    repo.upsert("A", _weights(("X", "X_a", 1)))
+
+    assert repo.delete("A")
+    assert not repo.delete("A")
+    assert not repo.exists("A")
+    assert repo.all().empty
+
+
+def test_refused_overwrite_of_a_preset_changes_nothing(repo):
+    repo.upsert("Preset", _weights(("X", "X_a", 1)), source="preset")
+    revision = repo.revision()
+
+    with pytest.raises(ValueError, match="preset"):
+        repo.upsert("Preset", _weights(("X", "X_a", 9)))
+
+    assert repo.get("Preset")["Weight"].tolist() == [1]
+    assert repo.revision() == revision
+
+
+def test_every_write_bumps_the_revision(repo):
+    start = repo.revision()
+    repo.upsert("A", _weights(("X", "X_a", 1)))
+    after_upsert = repo.revision()
+    repo.delete("A")
+
+    assert start < after_upsert < repo.revision()
+
+
+def test_csv_import_runs_once_and_keeps_later_edits(repo, tmp_path):
+    path = tmp_path / "model_weights.csv"
+    path.write_text("\ufeffModel,Axis,Variable,Weight\n Growth ,x, X_a ,1\nGrowth,Y,Y_b,2\nRisk,Z,Z_c,3\n",
+                    encoding="utf-8")
+
+    assert repo.import_csv(str(path), source="preset") == ["Growth", "Risk"]
+    assert repo.get("Growth")[["Axis", "Variable"]].values.tolist() == [["X", "X_a"], ["Y", "Y_b"]]
+
+    repo.upsert("Risk", _weights(("Z", "Z_c", 5)), source="preset")
+    assert repo.import_csv(str(path), source="preset") == []
+    assert repo.get("Risk")["Weight"].tolist() == [5]
+    assert repo.list_models(source="preset") == ["Growth", "Risk"]
@@ -0,0 +1,20 @@
+from horizon.years import YearIndex, resolve_year
+
+
+def test_resolve_year_prefers_the_latest_year_at_or_before():
+    assert resolve_year([2023, 2025], 2025) == 2025
+    assert resolve_year([2023, 2025], 2024) == 2023
+    assert resolve_year([2023, 2025], 2028) == 2025
+
+
+def test_resolve_year_uses_the_earliest_year_of_a_later_series():
+    assert resolve_year([2026, 2027], 2025) == 2026
+
+
+def test_year_index_maps_series_and_records_fallbacks():
+    index = YearIndex(["X_plain", "Y_debt_2024", "Y_debt_2026"], years=[2025, 2026, 2027])
+
+    assert index.variables == ["X_plain", "Y_debt_2024", "Y_debt_2026", "Y_debt"]
+    assert index.source_columns(2025, ["X_plain", "Y_debt"]) == ["X_plain", "Y_debt_2024"]
+    assert index.source_columns(2027, ["Y_debt", "Y_debt_2024"]) == ["Y_debt_2026", "Y_debt_2024"]
+    assert index.fallbacks.values.tolist() == [["Y_debt", 2025, 2024], ["Y_debt", 2027, 2026]]